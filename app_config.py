@@ -0,0 +1,14 @@
+import os
+import sys
+
+
+# 설정 파일 경로
+def get_config_path():
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Application Support/EPUB-Generator")
+    return os.path.expanduser("~/.epub-generator")
+
+def ensure_config_dir():
+    path = get_config_path()
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from batch_convert import convert_file
+from cancellation import CancelToken
+from conversion_stats import ProgressReporter
+from epub_gen import EpubGenerator
+from text_extractor import TextExtractor
+
+# split()이 실행기에서 한 번에 꺼내 오는 챕터 수 (스레드 전환 비용을 나눠 냄)
+SPLIT_BATCH = 32
+
+
+class AsyncConverter:
+    """
+    asyncio 이벤트 루프를 막지 않는 변환 API.
+    추출/분할/렌더링/기록은 executor에서 실행하고, 작업(Task)이 취소되면 CancelToken으로
+    진행 중인 변환을 다음 확인 지점에서 멈추게 한 뒤 (만들던 파일 정리까지) 기다렸다가 취소를 전달한다.
+
+        converter = AsyncConverter(max_concurrency=4)
+        result = await converter.convert("novel.txt", "novel.epub", title="제목")
+        async for title, content in converter.split("novel.txt"):
+            ...
+
+    executor: None이면 이벤트 루프의 기본 스레드 풀. ProcessPoolExecutor를 주면 convert/extract를
+              프로세스에서 실행한다 (split은 항상 스레드에서 실행)
+    max_concurrency: 동시에 실행할 convert/extract 수 (None이면 제한 없음, executor 크기를 따름)
+    """
+
+    def __init__(self, executor=None, max_concurrency=None):
+        self.executor = executor
+        self._limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._manager = None
+
+    async def convert(self, input_path, output_path, **options):
+        """
+        batch_convert.convert_file과 같은 인자와 결과 dict.
+        변환 실패는 결과의 'error'로 돌려주고, 작업이 취소되면 CancelledError
+        """
+        token = self._new_token()
+        return await self._run(functools.partial(convert_file, input_path, output_path,
+                                                 cancel_token=token, **options), token)
+
+    async def extract(self, file_path, info=None):
+        """
+        TextExtractor.extract (실패하면 ExtractionError).
+        info는 프로세스 실행기에서도 채워지도록 워커가 돌려준 값으로 갱신한다
+        """
+        token = self._new_token()
+        observer = ProgressReporter(cancel_token=token)
+        text, extracted = await self._run(functools.partial(_extract, file_path, observer), token)
+        if info is not None:
+            info.update(extracted)
+        return text
+
+    async def split(self, file_path, chunk_size=None, headings=None):
+        """
+        파일을 스트림으로 읽으며 (title, content) 챕터를 생성 (EpubGenerator.iter_chapters와 같은 경계).
+        읽기와 분할은 기본 스레드 풀에서 처리하므로 원고 전체를 메모리에 올리지 않고 루프도 막지 않는다.
+        """
+        loop = asyncio.get_running_loop()
+        token = CancelToken()
+        observer = ProgressReporter(cancel_token=token)
+        stream = await loop.run_in_executor(
+            None, functools.partial(TextExtractor.open_stream, file_path, observer=observer))
+        try:
+            chapters = EpubGenerator.iter_chapters(stream, chunk_size, observer, headings)
+            while True:
+                batch = await self._step(loop, functools.partial(_take, chapters, SPLIT_BATCH), token)
+                for chapter in batch:
+                    yield chapter
+                if len(batch) < SPLIT_BATCH:
+                    return
+        finally:
+            # async for를 중간에 멈추거나 취소된 경우에도 파일과 추출 워커를 정리
+            await loop.run_in_executor(None, stream.close)
+
+    def close(self):
+        """프로세스 실행기용으로 띄운 Manager 프로세스를 종료 (executor는 호출한 쪽이 종료)"""
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    def _new_token(self):
+        if not isinstance(self.executor, ProcessPoolExecutor):
+            return CancelToken()
+        # 이미 떠 있는 워커 프로세스에 작업마다 다른 토큰을 넘기려면 Manager 객체가 필요
+        if self._manager is None:
+            import multiprocessing
+            self._manager = multiprocessing.Manager()
+        return CancelToken(manager=self._manager)
+
+    async def _run(self, func, token):
+        loop = asyncio.get_running_loop()
+        async with self._limit or contextlib.nullcontext():
+            return await self._step(loop, func, token, self.executor)
+
+    async def _step(self, loop, func, token, executor=None):
+        future = loop.run_in_executor(executor, func)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            token.cancel()
+            # 변환이 취소 확인 지점에서 멈추고 만들던 파일을 지울 때까지 기다림
+            with contextlib.suppress(Exception):
+                await future
+            raise
+
+
+def _extract(file_path, observer):
+    """실행기(프로세스일 수 있음)에서 추출하고 (텍스트, info)를 반환"""
+    info = {}
+    text = TextExtractor.extract(file_path, info, observer=observer)
+    return text, info
+
+
+def _take(iterator, count):
+    return list(itertools.islice(iterator, count))
+
+
+_default_converter = None
+
+
+def _converter():
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = AsyncConverter()
+    return _default_converter
+
+
+async def convert(input_path, output_path, **options):
+    """기본 스레드 풀에서 파일 하나를 변환 (AsyncConverter.convert 참고)"""
+    return await _converter().convert(input_path, output_path, **options)
+
+
+def split(file_path, chunk_size=None, headings=None):
+    """async for title, content in split(path): ... (AsyncConverter.split 참고)"""
+    return _converter().split(file_path, chunk_size, headings)
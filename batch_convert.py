@@ -0,0 +1,196 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from cancellation import ConversionCancelled
+from conversion_stats import ConversionStats, ProgressReporter
+from epub_gen import EpubGenerator, StreamingEpubGenerator, IncrementalEpubGenerator
+from extract_cache import ExtractionCache
+from text_extractor import (BACKENDS, ExtractionError, MissingLibraryError, backend_available,
+                            load_backend, require_library)
+
+
+def convert_file(input_path, output_path, title=None, author="Unknown",
+                 metadata=None, line_height=None, streaming=False, cache_size=None,
+                 stats=False, cancel_token=None, incremental=False, compression=None,
+                 heading_patterns=None, part_size=None):
+    """
+    파일 하나를 추출 → 챕터 분할 → EPUB 생성까지 처리하고 결과 dict를 반환.
+    예외를 밖으로 던지지 않고 결과의 'error'에 담는다.
+    cache_size: 추출 캐시 용량(바이트). 지정하면 기본 위치의 ExtractionCache 사용
+    stats: True면 단계별 시간/카운터를 결과의 'stats'에 담음 (ConversionStats.as_dict)
+    cancel_token: CancelToken. 취소되면 단계/페이지/챕터 단위로 멈추고 만들던 파일을 지움
+    incremental: 이전 빌드에서 바뀌지 않은 챕터를 재사용 (IncrementalEpubGenerator)
+    compression: zip 압축 수준 (store/fast/default/max, streaming/incremental일 때만)
+    heading_patterns: 기본 형식 외에 인식할 챕터 제목 형식 목록 (chapter_headings 참고)
+    part_size: 챕터 XHTML 파일 최대 크기 (바이트, 0이면 나누지 않음, None이면 기본값)
+    """
+    started = time.perf_counter()
+    result = new_result(input_path, output_path)
+    stats = ConversionStats() if stats else None
+    observer = stats
+    if cancel_token is not None:
+        observer = ProgressReporter(cancel_token=cancel_token, forward=stats)
+    gen = None
+    try:
+        title = title or os.path.splitext(os.path.basename(input_path))[0]
+        if incremental:
+            gen = IncrementalEpubGenerator(title, output_path, author, observer=observer)
+        elif streaming:
+            gen = StreamingEpubGenerator(title, output_path, author, observer=observer)
+        else:
+            gen = EpubGenerator(title, author, observer=observer)
+        if compression and isinstance(gen, StreamingEpubGenerator):
+            # 파일 단위로 이미 병렬이므로 압축 스레드는 하나
+            gen.set_compression(compression)
+        gen.apply_metadata(metadata or {})
+        if line_height:
+            gen.set_line_height(line_height)
+        if heading_patterns:
+            gen.set_heading_patterns(heading_patterns)
+        if part_size is not None:
+            gen.set_part_size(part_size)
+
+        # 북마크가 있는 PDF, DOCX는 문서 구조로 챕터를 나눔 (추출 캐시를 거치지 않음)
+        counts = gen.process_document(input_path)
+        if counts is None:
+            info = {}
+            if cache_size:
+                content = ExtractionCache(max_bytes=cache_size).extract(input_path, info,
+                                                                        observer=observer)
+            else:
+                content = gen.extract_text(input_path, info)
+            result['encoding'] = info.get('encoding')
+            result['encoding_confidence'] = info.get('confidence')
+            if not content or not content.strip():
+                raise ExtractionError("텍스트를 추출하지 못했습니다.")
+
+            # 파싱한 원고에서 단어/글자 수도 함께 보고
+            manuscript = gen.parse_manuscript(content)
+            counts = manuscript.counts()
+            gen.process_text(manuscript)
+        result['counts'] = counts
+        gen.generate(output_path)
+
+        result['output_size'] = os.path.getsize(output_path)
+        if incremental:
+            result['reused_chapters'] = gen.reused
+        result['success'] = True
+    except Exception as e:
+        result['error'] = str(e) or type(e).__name__
+        result['cancelled'] = isinstance(e, ConversionCancelled)
+        if isinstance(gen, StreamingEpubGenerator):
+            gen.abort()
+    result['duration'] = time.perf_counter() - started
+    if stats:
+        result['stats'] = stats.as_dict()
+    return result
+
+
+def build_jobs(files, output_folder, author="Unknown", metadata=None,
+               line_height=None, streaming=False, cache_size=None, stats=False,
+               incremental=False, compression=None, heading_patterns=None, part_size=None):
+    """
+    입력 파일 목록으로 convert_file 인자 목록을 만든다.
+    동시에 변환하므로 같은 이름의 출력 파일이 겹치지 않게 번호를 붙인다.
+    """
+    jobs = []
+    used = set()
+    for file_path in files:
+        title = os.path.splitext(os.path.basename(file_path))[0]
+        name = f"{title}.epub"
+        n = 2
+        while name.lower() in used:
+            name = f"{title} ({n}).epub"
+            n += 1
+        used.add(name.lower())
+        jobs.append({
+            'input_path': file_path,
+            'output_path': os.path.join(output_folder, name),
+            'title': title,
+            'author': author,
+            'metadata': metadata,
+            'line_height': line_height,
+            'streaming': streaming,
+            'cache_size': cache_size,
+            'stats': stats,
+            'incremental': incremental,
+            'compression': compression,
+            'heading_patterns': heading_patterns,
+            'part_size': part_size,
+        })
+    return jobs
+
+
+def run_batch(jobs, workers=0, cancel_token=None):
+    """
+    여러 파일을 프로세스 풀에서 동시에 변환하고, 끝나는 순서대로 결과 dict를 생성.
+    jobs: convert_file 키워드 인자 dict 목록 (build_jobs 참고)
+    workers: 동시 변환 수 (0이면 CPU 코어 수, 1이면 현재 프로세스에서 순서대로)
+    cancel_token: CancelToken(shared=True). 취소하면 진행 중인 파일은 중단되고
+                  남은 파일은 바로 'cancelled' 결과로 끝난다.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            yield convert_file(**job, cancel_token=cancel_token)
+        return
+
+    # 토큰은 워커 프로세스를 만들 때만 넘길 수 있으므로 initializer로 전달
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(cancel_token,)) as pool:
+        futures = {pool.submit(convert_in_worker, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # 워커 프로세스가 비정상 종료된 경우 등
+                job = futures[future]
+                result = new_result(job['input_path'], job['output_path'])
+                result['error'] = str(e) or type(e).__name__
+                yield result
+
+
+_worker_cancel_token = None
+
+
+def init_worker(cancel_token, preload=False):
+    """
+    변환 워커 프로세스 initializer (run_batch, conversion_server 공용).
+    cancel_token: 이 워커의 convert_in_worker가 확인할 취소 토큰
+    """
+    global _worker_cancel_token
+    _worker_cancel_token = cancel_token
+    if preload:
+        # 오래 떠 있는 워커 (conversion_server): 첫 작업이 라이브러리 import 비용을 내지 않도록
+        # 설치된 추출/EPUB 라이브러리를 미리 불러 둠
+        for ext in BACKENDS:
+            if backend_available(ext):
+                load_backend(ext)
+        try:
+            require_library("ebooklib.epub", "ebooklib")
+        except MissingLibraryError:
+            pass  # 작업 결과에 오류로 보고됨
+
+
+def convert_in_worker(job):
+    """init_worker로 준비한 워커에서 convert_file(**job) 실행"""
+    return convert_file(**job, cancel_token=_worker_cancel_token)
+
+
+def new_result(input_path, output_path):
+    """convert_file이 돌려주는 결과 dict의 초깃값 (워커가 비정상 종료됐을 때 보고용으로도 씀)"""
+    return {
+        'input': input_path,
+        'output': output_path,
+        'success': False,
+        'error': None,
+        'duration': 0.0,
+        'output_size': 0,
+        'encoding': None,             # TXT만 해당
+        'encoding_confidence': None,
+        'stats': None,                # convert_file(stats=True)일 때 단계별 측정값
+        'cancelled': False,
+        'reused_chapters': None,      # incremental일 때 이전 빌드에서 복사한 챕터 수
+        'counts': None,               # 원고의 {'words', 'chars'(공백 제외), 'hangul'}
+    }
@@ -0,0 +1,71 @@
+"""
+EPUB zip 압축 수준(store/fast/default/max)과 압축 스레드 수에 따른 크기/시간 비교.
+챕터 렌더링은 미리 끝내 두고 EpubStreamWriter 기록 시간만 측정한다.
+
+    python benchmarks/bench_compression.py
+    python benchmarks/bench_compression.py --size-mb 50 --chapters 2000 --threads 1 4 8
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from corpus import iter_corpus
+from epub_gen import StreamingEpubGenerator
+from epub_writer import COMPRESSION_LEVELS, EpubStreamWriter
+
+
+def render_book(size_mb, chapters, seed):
+    text = "\n".join(iter_corpus(size_mb * 1024 * 1024, chapters, seed=seed))
+    return [(title, StreamingEpubGenerator.render_chapter(title, content))
+            for title, content in StreamingEpubGenerator.iter_chapters(io.StringIO(text))]
+
+
+def write_book(path, rendered, compression, threads):
+    started = time.perf_counter()
+    writer = EpubStreamWriter(path, "ko", compression, threads)
+    toc = []
+    for index, (title, body) in enumerate(rendered, 1):
+        file_name = f"chap_{index:03d}.xhtml"
+        writer.write_document(f"chapter_{index}", file_name, title, body)
+        toc.append((file_name, title))
+    spine = ["nav"] + [f"chapter_{i}" for i in range(1, len(toc) + 1)]
+    writer.finish("Benchmark", "urn:uuid:benchmark", {}, toc, spine)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EPUB zip compression levels")
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--chapters", type=int, default=1000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rendered = render_book(args.size_mb, args.chapters, args.seed)
+    raw_size = sum(len(body.encode("utf-8")) for _, body in rendered)
+    print(f"{len(rendered)} chapters, {raw_size / 1024 / 1024:.1f} MB of XHTML body")
+    print(f"{'level':<8} {'threads':>7} {'seconds':>8} {'MB/s':>7} {'size MB':>8} {'ratio':>6}")
+
+    threads_list = sorted(set(args.threads))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.epub")
+        for compression in COMPRESSION_LEVELS:
+            # store는 압축하지 않으므로 스레드 수와 무관
+            for threads in (threads_list if COMPRESSION_LEVELS[compression] else [1]):
+                best = min(write_book(path, rendered, compression, threads)
+                           for _ in range(args.repeat))
+                size = os.path.getsize(path)
+                print(f"{compression:<8} {threads:>7} {best:>8.3f} "
+                      f"{raw_size / 1024 / 1024 / best:>7.1f} {size / 1024 / 1024:>8.2f} "
+                      f"{size / raw_size:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+DOCX 추출 비교: python-docx 문서 모델(이전 구현) vs word/document.xml 점진적 파싱.
+제목 스타일(제목 1)로 챕터를 표시한 DOCX를 만들어 시간과 최대 메모리를 잰다.
+lxml이 잡는 메모리는 tracemalloc에 잡히지 않으므로 방식마다 새 프로세스에서 실행해 최대 RSS를 비교한다.
+
+    python benchmarks/bench_docx.py
+    python benchmarks/bench_docx.py --size-mb 50 --chapters 2000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from corpus import DOCX_HEADER, HEADING_STYLES, iter_corpus
+from text_extractor import TextExtractor
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+</Types>"""
+
+RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>
+<w:pPr><w:outlineLvl w:val="0"/></w:pPr></w:style>
+</w:styles>"""
+
+
+def make_docx(path, size_bytes, chapters, style, seed):
+    """챕터 제목 줄에 제목 1 스타일을 붙인 DOCX 기록 (런을 여러 개로 나눠 Word 문서와 비슷하게)"""
+    heading = HEADING_STYLES[style]
+    titles = {heading(n) for n in range(1, chapters + 1)}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", CONTENT_TYPES)
+        z.writestr("_rels/.rels", RELS)
+        z.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS)
+        z.writestr("word/styles.xml", STYLES)
+        with z.open("word/document.xml", "w") as f:
+            f.write(DOCX_HEADER.encode("utf-8"))
+            for line in iter_corpus(size_bytes, chapters, style, seed):
+                if line in titles:
+                    f.write(f'<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+                            f'<w:r><w:t>{escape(line)}</w:t></w:r></w:p>'.encode("utf-8"))
+                    continue
+                runs = "".join(f'<w:r><w:rPr><w:sz w:val="22"/></w:rPr>'
+                               f'<w:t xml:space="preserve">{escape(part)} </w:t></w:r>'
+                               for part in line.split(". ") if part)
+                f.write(f"<w:p>{runs}</w:p>".encode("utf-8"))
+            f.write(b"<w:sectPr/></w:body></w:document>")
+
+
+def python_docx_extract(path):
+    """이전 구현 (python-docx 문서 모델 전체를 만든 뒤 문단 텍스트를 이어 붙임)"""
+    import docx
+    doc = docx.Document(path)
+    return "\n".join([para.text for para in doc.paragraphs]), None
+
+
+def streaming_extract(path):
+    return TextExtractor.read_docx(path)
+
+
+METHODS = {
+    "python-docx": python_docx_extract,
+    "streaming": streaming_extract,
+}
+
+
+def run_child(method, path):
+    """자식 프로세스: 한 방식만 실행하고 시간/최대 RSS/결과 요약을 JSON으로 출력"""
+    started = time.perf_counter()
+    text, headings = METHODS[method](path)
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트
+    peak_mb = peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+    print(json.dumps({
+        'seconds': elapsed,
+        'peak_mb': peak_mb,
+        'chars': len(text),
+        'text_hash': hash(text),
+        'headings': None if headings is None else len(headings),
+    }))
+
+
+def measure(method, path, repeat):
+    best = None
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, __file__, "--run", method, path],
+                              capture_output=True, text=True,
+                              env=dict(os.environ, PYTHONHASHSEED="0"))
+        if proc.returncode != 0:
+            print(f"  {method} failed: {proc.stderr.strip().splitlines()[-1:]}")
+            return None
+        result = json.loads(proc.stdout)
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DOCX extraction time and peak memory")
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--chapters", type=int, default=500)
+    parser.add_argument("--style", choices=sorted(HEADING_STYLES), default="je_hwa")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--run", nargs=2, metavar=("METHOD", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run:
+        run_child(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.docx")
+        make_docx(path, args.size_mb * 1024 * 1024, args.chapters, args.style, args.seed)
+        with zipfile.ZipFile(path) as z:
+            xml_size = z.getinfo("word/document.xml").file_size
+        print(f"{args.chapters:,} chapters, {xml_size / 1024 / 1024:.1f} MB document.xml, "
+              f"{os.path.getsize(path) / 1024 / 1024:.1f} MB file")
+
+        results = {}
+        for method in METHODS:
+            results[method] = measure(method, path, args.repeat)
+        baseline = results["python-docx"]
+        current = results["streaming"]
+        if baseline is None:
+            print("  (python-docx is not installed: pip install python-docx)")
+        elif current and (baseline['chars'], baseline['text_hash']) != (current['chars'], current['text_hash']):
+            print("Output mismatch")
+            sys.exit(1)
+
+        print(f"{'':12} {'time (s)':>10} {'peak (MB)':>10} {'headings':>9}")
+        for method, result in results.items():
+            if result:
+                headings = "-" if result['headings'] is None else f"{result['headings']:,}"
+                print(f"{method:12} {result['seconds']:>10.2f} {result['peak_mb']:>10.1f} {headings:>9}")
+
+
+if __name__ == "__main__":
+    main()
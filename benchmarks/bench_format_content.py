@@ -0,0 +1,80 @@
+"""
+format_content 렌더링 속도 측정 (1k ~ 1M 줄)
+
+    python benchmarks/bench_format_content.py
+    python benchmarks/bench_format_content.py --sizes 1000 10000 --repeat 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from epub_gen import EpubGenerator
+
+
+def legacy_format_content(text):
+    """이전 구현 (문자열 += 누적, startswith 연쇄)"""
+    lines = text.split("\n")
+    formatted_html = ""
+
+    for line in lines:
+        line_stripped = line.strip()
+        if not line_stripped:
+            continue
+
+        if line_stripped in ["***", "---", "###", "==="]:
+            formatted_html += '<p class="scene-break">***</p>'
+        elif line_stripped.startswith('"') or line_stripped.startswith("'") or line_stripped.startswith('「') or line_stripped.startswith('『'):
+            formatted_html += f'<p class="dialogue">{line_stripped}</p>'
+        else:
+            formatted_html += f"<p>{line_stripped}</p>"
+
+    return formatted_html
+
+
+def make_text(line_count, seed=0):
+    rng = random.Random(seed)
+    samples = [
+        "그는 천천히 고개를 들어 하늘을 바라보았다.",
+        '"정말 그렇게 생각해?"',
+        "'이건 말도 안 돼.'",
+        "「어서 와.」",
+        "『마법의 서』를 펼쳤다.",
+        "  들여쓰기된 서술 문장입니다.  ",
+        "***",
+        "",
+    ]
+    return "\n".join(rng.choice(samples) for _ in range(line_count))
+
+
+def timed(func, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EpubGenerator.format_content")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'lines':>10} {'legacy (s)':>12} {'current (s)':>12} {'speedup':>8}")
+    for size in args.sizes:
+        text = make_text(size)
+        legacy_time, legacy_html = timed(legacy_format_content, text, args.repeat)
+        current_time, current_html = timed(EpubGenerator.format_content, text, args.repeat)
+        if legacy_html != current_html:
+            print(f"Output mismatch at {size} lines")
+            sys.exit(1)
+        print(f"{size:>10} {legacy_time:>12.4f} {current_time:>12.4f} {legacy_time / current_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+챕터 제목 탐색 비교: 기본 정규식(DEFAULT_PATTERN.finditer) vs HeadingDetector.
+제목이 촘촘한 원고, 제목이 하나도 없는 원고, 제목 형식의 첫 글자(제, 숫자, c/e/p)로 시작하는
+본문 줄이 많은 한국어/영어 원고에서 시간을 재고, 두 방식의 매치가 같은지 확인한다.
+
+    python benchmarks/bench_headings.py
+    python benchmarks/bench_headings.py --size-mb 50 --dense-chapters 50000 --style chapter
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from corpus import HEADING_STYLES, iter_corpus
+from chapter_headings import DEFAULT_PATTERN, HeadingDetector
+
+# 사용자 형식을 추가했을 때의 비용 확인용
+USER_PATTERNS = ["【{n}화】", "#{n}.", "Ch. {n}"]
+
+
+def build_inputs(size_mb, dense_chapters, prose_chapters, style, seed):
+    size = size_mb * 1024 * 1024
+    dense = "\n".join(iter_corpus(size, dense_chapters, style, seed))
+    # 챕터 하나짜리 원고에서 제목 줄을 빼면 제목이 없는 원고
+    free = "\n".join(iter_corpus(size, 1, style, seed)).split("\n", 1)[1]
+    prefixed = "\n".join(iter_corpus(size, prose_chapters, style, seed, prose="korean_prefixed"))
+    english = "\n".join(iter_corpus(size, prose_chapters, "chapter", seed, prose="english"))
+    return {"heading-dense": dense, "heading-free": free,
+            "prefixed-prose": prefixed, "english-prose": english}
+
+
+def spans(matches):
+    return [(m.start(), m.end(), m.group(1)) for m in matches]
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chapter heading detection")
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--dense-chapters", type=int, default=20000)
+    parser.add_argument("--prose-chapters", type=int, default=1000)
+    parser.add_argument("--style", choices=sorted(HEADING_STYLES), default="je_hwa")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engines = {
+        "regex": DEFAULT_PATTERN,
+        "detector": HeadingDetector(),
+        "detector+user": HeadingDetector(USER_PATTERNS),
+    }
+    print(f"{'input':<14} {'engine':<14} {'headings':>8} {'seconds':>8} {'MB/s':>8} {'speedup':>8}")
+    for name, text in build_inputs(args.size_mb, args.dense_chapters, args.prose_chapters,
+                                   args.style, args.seed).items():
+        size_mb = len(text.encode("utf-8")) / 1024 / 1024
+        baseline = None
+        expected = None
+        for engine_name, engine in engines.items():
+            seconds, found = best_of(args.repeat, lambda: spans(engine.finditer(text)))
+            if expected is None:
+                baseline, expected = seconds, found
+            elif found != expected:
+                print(f"  MISMATCH: {engine_name} found {len(found)} headings, regex {len(expected)}")
+            print(f"{name:<14} {engine_name:<14} {len(found):>8} {seconds:>8.3f} "
+                  f"{size_mb / seconds:>8.1f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+HWPX 섹션 파싱의 최대 메모리/시간 측정 (ElementTree.parse 전체 트리 vs 점진적 파싱)
+
+    python benchmarks/bench_hwpx_memory.py
+    python benchmarks/bench_hwpx_memory.py --paragraphs 1000000 --sections 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from xml.etree import ElementTree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_extractor import TextExtractor
+
+SECTION_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">'
+)
+PARAGRAPH = (
+    '<hp:p id="{i}" paraPrIDRef="0" styleIDRef="0"><hp:run charPrIDRef="0">'
+    '<hp:t>제{i}문단. 그는 천천히 고개를 들어 하늘을 바라보았다.</hp:t></hp:run>'
+    '<hp:linesegarray><hp:lineseg textpos="0" vertpos="0" vertsize="1000"/></hp:linesegarray></hp:p>'
+)
+
+
+def legacy_extract_hwpx(file_path):
+    """이전 구현 (섹션마다 전체 트리를 만든 뒤 순회, 이름순 정렬)"""
+    with zipfile.ZipFile(file_path, 'r') as z:
+        content_files = [f for f in z.namelist() if f.startswith('Contents/section')]
+        full_text = []
+        for cf in sorted(content_files):
+            with z.open(cf) as f:
+                root = ElementTree.parse(f).getroot()
+                for node in root.iter():
+                    tag = node.tag.split('}')[-1]
+                    if tag == 't' and node.text:
+                        full_text.append(node.text)
+                    elif tag == 'p':
+                        full_text.append("\n")
+        return "".join(full_text)
+
+
+def make_hwpx(path, paragraphs, sections):
+    per_section = paragraphs // sections
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        for s in range(sections):
+            with z.open(f"Contents/section{s}.xml", "w") as f:
+                f.write(SECTION_HEADER.encode("utf-8"))
+                for i in range(s * per_section, (s + 1) * per_section):
+                    f.write(PARAGRAPH.format(i=i).encode("utf-8"))
+                f.write(b"</hs:sec>")
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HWPX section parsing memory")
+    parser.add_argument("--paragraphs", type=int, default=200000)
+    parser.add_argument("--sections", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.hwpx")
+        make_hwpx(path, args.paragraphs, args.sections)
+        with zipfile.ZipFile(path) as z:
+            xml_size = sum(info.file_size for info in z.infolist())
+        print(f"{args.paragraphs:,} paragraphs, {args.sections} section(s), "
+              f"{xml_size / 1024 / 1024:.1f} MB uncompressed XML")
+
+        legacy_time, legacy_peak, legacy_text = measure(legacy_extract_hwpx, path)
+        current_time, current_peak, current_text = measure(TextExtractor._extract_hwpx, path)
+        if args.sections <= 10 and legacy_text != current_text:
+            print("Output mismatch")
+            sys.exit(1)
+
+        print(f"{'':10} {'time (s)':>10} {'peak (MB)':>10}")
+        print(f"{'legacy':10} {legacy_time:>10.2f} {legacy_peak / 1024 / 1024:>10.1f}")
+        print(f"{'current':10} {current_time:>10.2f} {current_peak / 1024 / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+변환 파이프라인 전체 벤치마크 (추출 → 챕터 분할 → 렌더링 → EPUB 생성)
+
+기준 조건(10 MB, 1,000챕터, 제N화, LF, TXT)에서 한 번에 한 가지 축만 바꿔 가며
+측정하고, 단계별 처리량(MB/s, chapters/s)과 최대 RSS를 JSON으로 기록한다.
+각 조건은 별도 프로세스에서 실행되므로 최대 RSS가 서로 섞이지 않는다.
+
+    python benchmarks/bench_pipeline.py --preset quick --output quick.json
+    python benchmarks/bench_pipeline.py --preset full --output full.json
+    python benchmarks/bench_pipeline.py --preset quick --compare baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from corpus import HEADING_STYLES, build_fixture
+
+MB = 1024 * 1024
+
+BASE_CASE = {
+    'format': "txt",
+    'size_mb': 10,
+    'chapters': 1000,
+    'style': "je_hwa",
+    'newline': "lf",
+}
+
+PRESETS = {
+    'quick': {
+        'size_mb': [1, 10],
+        'chapters': [1, 100, 1000],
+        'style': ["je_hwa", "markdown", "chapter"],
+        'newline': ["lf", "crlf"],
+        'format': ["txt", "hwpx"],
+    },
+    'full': {
+        'size_mb': [1, 10, 100, 500],
+        'chapters': [1, 10, 100, 1000, 10000],
+        'style': list(HEADING_STYLES),
+        'newline': ["lf", "crlf"],
+        'format': ["txt", "docx", "hwpx"],
+    },
+}
+
+
+def build_cases(preset):
+    """기준 조건에서 축 하나씩만 바꾼 조건 목록 (중복 제거)"""
+    cases = [dict(BASE_CASE)]
+    for axis, values in PRESETS[preset].items():
+        for value in values:
+            case = dict(BASE_CASE, **{axis: value})
+            if case not in cases:
+                cases.append(case)
+    for case in cases:
+        case['id'] = "{format}-{size_mb}mb-{chapters}ch-{style}-{newline}".format(**case)
+    return cases
+
+
+def run_case(case, fixtures_dir, seed):
+    """현재 프로세스에서 조건 하나를 측정 (--run-case로 호출됨)"""
+    from epub_gen import EpubGenerator
+    from text_extractor import TextExtractor
+
+    newline = "\r\n" if case['newline'] == "crlf" else "\n"
+    path, text_bytes = build_fixture(fixtures_dir, case['format'], case['size_mb'] * MB,
+                                     case['chapters'], case['style'], newline, seed)
+    data_mb = text_bytes / MB
+    stages = {}
+
+    def record(name, started, chapters=None):
+        elapsed = time.perf_counter() - started
+        stages[name] = {
+            'seconds': round(elapsed, 4),
+            'mb_per_s': round(data_mb / elapsed, 2) if elapsed else None,
+            'chapters_per_s': round(chapters / elapsed, 1) if chapters and elapsed else None,
+            'peak_rss_mb': peak_rss_mb(),
+        }
+
+    gen = EpubGenerator("Benchmark", "Benchmark")
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        text = TextExtractor.extract(path)
+        record('extract', started)
+
+        started = time.perf_counter()
+        manuscript = gen.parse_manuscript(text)
+        record('split', started, len(manuscript))
+
+        started = time.perf_counter()
+        gen.process_text(manuscript)
+        record('render', started, len(gen.chapters))
+
+        started = time.perf_counter()
+        output_path = os.path.join(tmp, "out.epub")
+        gen.generate(output_path)
+        record('generate', started, len(gen.chapters))
+        epub_size = os.path.getsize(output_path)
+
+    return dict(case, text_mb=round(data_mb, 2), detected_chapters=len(manuscript),
+                epub_bytes=epub_size, stages=stages, peak_rss_mb=peak_rss_mb())
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return round(peak / MB if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def compare(results, baseline, threshold):
+    """기준 결과 대비 단계 시간이 threshold 비율 이상 늘어난 항목 출력, 회귀 수 반환"""
+    previous = {case['id']: case for case in baseline['cases']}
+    regressions = 0
+    for case in results['cases']:
+        old = previous.get(case['id'])
+        if not old or 'stages' not in case or 'stages' not in old:
+            continue
+        for stage, timing in case['stages'].items():
+            before = old['stages'].get(stage, {}).get('seconds')
+            if not before:
+                continue
+            ratio = timing['seconds'] / before
+            if ratio > 1 + threshold:
+                regressions += 1
+                print(f"REGRESSION {case['id']} {stage}: {before:.3f}s -> {timing['seconds']:.3f}s "
+                      f"({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the full conversion pipeline")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures-dir", default=os.path.join(BENCH_DIR, ".fixtures"))
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed slowdown ratio before reporting a regression")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case), args.fixtures_dir, args.seed)))
+        return
+
+    results = {
+        'meta': {
+            'preset': args.preset,
+            'seed': args.seed,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'cases': [],
+    }
+    for case in build_cases(args.preset):
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run-case", json.dumps(case),
+             "--fixtures-dir", args.fixtures_dir, "--seed", str(args.seed)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"
+            results['cases'].append(dict(case, error=error))
+            print(f"{case['id']:45} ERROR {error}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        results['cases'].append(result)
+        summary = "  ".join(f"{name} {stage['mb_per_s']}MB/s" for name, stage in result['stages'].items())
+        print(f"{case['id']:45} {summary}  peak {result['peak_rss_mb']}MB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+시작 시간 측정: `python epub_gen.py --help`와 GUI 첫 창 표시까지의 시간.
+추출/EPUB 라이브러리(pypdf, ebooklib+lxml)는 처음 쓸 때 불러오므로,
+참고용으로 이 라이브러리들을 미리 import하는 데 드는 시간도 함께 출력한다.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 20 --offscreen
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EAGER_IMPORTS = ["ebooklib.epub", "pypdf"]
+
+# epub_gui_qt.py의 __main__과 같은 순서로 첫 창을 띄우고, 이벤트 루프가 돌기 시작하면 바로 종료
+GUI_STARTUP = """
+import sys
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+import epub_gui_qt
+epub_gui_qt.apply_scale_before_app()
+app = QApplication(sys.argv)
+window = epub_gui_qt.EpubGuiQt()
+window.show()
+QTimer.singleShot(0, app.quit)
+sys.exit(app.exec())
+"""
+
+
+def measure(command, repeat, env=None):
+    """명령을 repeat번 실행해 (최소, 중앙값) 초를 반환. 실패하면 None"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        proc = subprocess.run(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, text=True)
+        elapsed = time.perf_counter() - started
+        if proc.returncode != 0:
+            print(f"  failed: {' '.join(command)}\n  {proc.stderr.strip().splitlines()[-1:]}")
+            return None
+        times.append(elapsed)
+    return min(times), statistics.median(times)
+
+
+def report(label, result):
+    if result:
+        print(f"{label:<40} best {result[0] * 1000:7.1f} ms   median {result[1] * 1000:7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI and GUI cold start")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--offscreen", action="store_true",
+                        help="Run the GUI with QT_QPA_PLATFORM=offscreen (headless machines)")
+    parser.add_argument("--skip-gui", action="store_true")
+    args = parser.parse_args()
+
+    report("python -c pass (interpreter only)", measure([sys.executable, "-c", "pass"], args.repeat))
+    report("epub_gen.py --help", measure([sys.executable, "epub_gen.py", "--help"], args.repeat))
+
+    installed = [name for name in EAGER_IMPORTS
+                 if subprocess.run([sys.executable, "-c", f"import {name}"],
+                                   capture_output=True).returncode == 0]
+    if installed:
+        report(f"import {', '.join(installed)} (now deferred)",
+               measure([sys.executable, "-c", "import " + ", ".join(installed)], args.repeat))
+
+    if not args.skip_gui:
+        env = dict(os.environ)
+        if args.offscreen:
+            env["QT_QPA_PLATFORM"] = "offscreen"
+        report("epub_gui_qt.py to first window", measure([sys.executable, "-c", GUI_STARTUP],
+                                                          args.repeat, env))
+
+
+if __name__ == "__main__":
+    main()
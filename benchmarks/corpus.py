@@ -0,0 +1,195 @@
+"""
+벤치마크용 합성 웹소설 원고와 TXT/DOCX/HWPX 파일 생성.
+같은 인자와 seed면 항상 같은 파일이 만들어진다.
+"""
+import os
+import random
+import zipfile
+from xml.sax.saxutils import escape
+
+# 기본 챕터 제목 형식 (chapter_headings.DEFAULT_PATTERN)이 인식하는 제목 형식
+HEADING_STYLES = {
+    "markdown": lambda n: f"# {n}화",
+    "je_hwa": lambda n: f"제{n}화",
+    "je_jang_spaced": lambda n: f"제 {n} 장 새로운 시작",
+    "number_hwa": lambda n: f"{n}화",
+    "chapter": lambda n: f"Chapter {n}",
+    "episode": lambda n: f"EP.{n}",
+    "part": lambda n: f"Part {n}",
+    "korean_marker": lambda n: "프롤로그" if n == 1 else ("에필로그" if n % 50 == 0 else f"제{n}화"),
+}
+
+SENTENCES = [
+    "그는 천천히 고개를 들어 하늘을 바라보았다.",
+    "바람이 불어와 머리카락을 흩날렸다.",
+    "마을 어귀의 오래된 느티나무 아래에서 그녀가 기다리고 있었다.",
+    "검을 쥔 손에 힘이 들어갔다.",
+    "시스템 메시지가 눈앞에 떠올랐다.",
+    "아무도 그 사실을 알지 못했다.",
+    "멀리서 종소리가 울려 퍼졌다.",
+]
+DIALOGUES = [
+    '"정말 그렇게 생각해?"',
+    '"지금 당장 떠나야 해."',
+    "'이건 말도 안 돼.'",
+    "「어서 와. 오래 기다렸어.」",
+    "『던전 공략을 시작합니다.』",
+]
+# 제목이 아니지만 제목 형식의 첫 글자(제, 숫자, c/e/p)로 시작하는 문장.
+# HeadingDetector가 후보로 고른 뒤 전체 패턴으로 걸러 내야 하는 줄이 촘촘한 원고를 만든다.
+PREFIXED_SENTENCES = [
+    "제가 먼저 가 보겠습니다.",
+    "제법 쌀쌀한 바람이 골목을 지나갔다.",
+    "3일 뒤, 그는 다시 마을로 돌아왔다.",
+    "10년 전의 일을 기억하는 사람은 없었다.",
+    "2층 창문에는 아직 불이 켜져 있었다.",
+    "제국의 기사단이 성문 앞에 모여 있었다.",
+]
+ENGLISH_SENTENCES = [
+    "Perhaps it was already too late.",
+    "Every window in the castle was dark.",
+    "Coming back here had been a mistake.",
+    "Each step echoed through the empty hall.",
+    "Part of him still wanted to believe her.",
+    "She smiled and said nothing.",
+    "Chapters of his old life were closing one by one.",
+    "People in the village never spoke of it.",
+]
+ENGLISH_DIALOGUES = [
+    '"Do you really think so?"',
+    '"Come with me, now."',
+    '"Everyone is waiting for you."',
+]
+# 본문 문장 종류: (서술 문장, 대사)
+PROSE = {
+    "korean": (SENTENCES, DIALOGUES),
+    "korean_prefixed": (PREFIXED_SENTENCES, DIALOGUES),
+    "english": (ENGLISH_SENTENCES, ENGLISH_DIALOGUES),
+}
+
+
+def iter_corpus(size_bytes, chapters, style="je_hwa", seed=0, prose="korean"):
+    """UTF-8 기준 size_bytes 정도의 원고를 줄 단위로 생성 (줄바꿈 미포함). prose: PROSE의 키"""
+    rng = random.Random(seed)
+    heading = HEADING_STYLES[style]
+    sentences, dialogues = PROSE[prose]
+    per_chapter = max(size_bytes // max(chapters, 1), 1)
+    for n in range(1, chapters + 1):
+        yield heading(n)
+        yield ""
+        written = 0
+        while written < per_chapter:
+            roll = rng.random()
+            if roll < 0.3:
+                line = rng.choice(dialogues)
+            elif roll < 0.32:
+                line = "***"
+            else:
+                line = " ".join(rng.choice(sentences) for _ in range(rng.randint(1, 4)))
+            yield line
+            written += len(line.encode("utf-8")) + 1
+
+
+def write_txt(path, lines, newline="\n"):
+    """TXT 파일 기록, 기록한 바이트 수 반환"""
+    size = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for line in lines:
+            data = line + newline
+            f.write(data)
+            size += len(data.encode("utf-8"))
+    return size
+
+
+def write_docx(path, lines):
+    """python-docx 없이 문단만 있는 최소 DOCX 기록, 본문 바이트 수 반환"""
+    size = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", DOCX_CONTENT_TYPES)
+        z.writestr("_rels/.rels", DOCX_RELS)
+        with z.open("word/document.xml", "w") as f:
+            f.write(DOCX_HEADER.encode("utf-8"))
+            for line in lines:
+                f.write(f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+                        .encode("utf-8"))
+                size += len(line.encode("utf-8")) + 1
+            f.write(b"<w:sectPr/></w:body></w:document>")
+    return size
+
+
+def write_hwpx(path, lines, paragraphs_per_section=20000):
+    """섹션 여러 개로 나눈 HWPX 기록, 본문 바이트 수 반환"""
+    size = 0
+    section = 0
+    count = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr(zipfile.ZipInfo("mimetype"), "application/hwp+zip",
+                   compress_type=zipfile.ZIP_STORED)
+        f = z.open(f"Contents/section{section}.xml", "w")
+        f.write(HWPX_HEADER.encode("utf-8"))
+        for line in lines:
+            if count >= paragraphs_per_section:
+                f.write(b"</hs:sec>")
+                f.close()
+                section += 1
+                count = 0
+                f = z.open(f"Contents/section{section}.xml", "w")
+                f.write(HWPX_HEADER.encode("utf-8"))
+            f.write(f'<hp:p><hp:run><hp:t>{escape(line)}</hp:t></hp:run></hp:p>'.encode("utf-8"))
+            size += len(line.encode("utf-8")) + 1
+            count += 1
+        f.write(b"</hs:sec>")
+        f.close()
+    return size
+
+
+def build_fixture(directory, fmt, size_bytes, chapters, style="je_hwa", newline="\n", seed=0):
+    """
+    조건에 맞는 원고 파일을 만들고 (경로, 본문 바이트 수)를 반환.
+    같은 조건의 파일이 이미 있으면 다시 만들지 않는다.
+    """
+    os.makedirs(directory, exist_ok=True)
+    eol = "crlf" if newline == "\r\n" else "lf"
+    name = f"corpus_{size_bytes}_{chapters}_{style}_{eol}_{seed}.{fmt}"
+    path = os.path.join(directory, name)
+    size_path = path + ".size"
+    if os.path.exists(path) and os.path.exists(size_path):
+        with open(size_path) as f:
+            return path, int(f.read())
+
+    lines = iter_corpus(size_bytes, chapters, style, seed)
+    if fmt == "txt":
+        size = write_txt(path, lines, newline)
+    elif fmt == "docx":
+        size = write_docx(path, lines)
+    elif fmt == "hwpx":
+        size = write_hwpx(path, lines)
+    else:
+        raise ValueError(f"Unsupported fixture format: {fmt}")
+    with open(size_path, "w") as f:
+        f.write(str(size))
+    return path, size
+
+
+DOCX_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+DOCX_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCX_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+)
+
+HWPX_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">'
+)
@@ -19,9 +19,28 @@ pyinstaller --noconsole --windowed --clean \
     --icon "assets/icon.icns" \
     --add-data "epub_gen.py:." \
     --add-data "text_extractor.py:." \
+    --add-data "epub_writer.py:." \
+    --add-data "batch_convert.py:." \
+    --add-data "extract_cache.py:." \
+    --add-data "app_config.py:." \
+    --add-data "manuscript.py:." \
+    --add-data "chapter_headings.py:." \
+    --add-data "text_counts.py:." \
+    --add-data "conversion_stats.py:." \
+    --add-data "cancellation.py:." \
     --hidden-import "text_extractor" \
+    --hidden-import "epub_writer" \
+    --hidden-import "batch_convert" \
+    --hidden-import "extract_cache" \
+    --hidden-import "app_config" \
+    --hidden-import "manuscript" \
+    --hidden-import "chapter_headings" \
+    --hidden-import "text_counts" \
+    --hidden-import "conversion_stats" \
+    --hidden-import "cancellation" \
+    --hidden-import "ebooklib" \
+    --hidden-import "ebooklib.epub" \
     --hidden-import "pypdf" \
-    --hidden-import "docx" \
     --hidden-import "hwp5" \
     --hidden-import "hwp5.xmlmodel" \
     --hidden-import "hwp5.hwp5txt" \
@@ -0,0 +1,39 @@
+import threading
+
+
+class ConversionCancelled(Exception):
+    """사용자가 변환을 취소함"""
+
+    def __init__(self, message="변환이 취소되었습니다."):
+        super().__init__(message)
+
+
+class CancelToken:
+    """
+    변환 취소 요청 플래그.
+    다른 스레드에서 cancel()하면 진행 중인 변환이 다음 확인 지점
+    (TXT 청크, PDF 페이지, HWPX 섹션, 챕터 단위)에서 ConversionCancelled로 멈춘다.
+    shared=True면 프로세스 풀 워커에도 넘길 수 있다 (일괄 변환용, 풀을 만들 때 initializer로 전달).
+    manager(multiprocessing.Manager)를 주면 작업 인자로 pickle해 보낼 수 있는 토큰이 된다
+    (이미 떠 있는 프로세스 풀에 작업마다 따로 취소할 수 있는 토큰을 넘길 때).
+    """
+
+    def __init__(self, shared=False, manager=None):
+        if manager is not None:
+            self._event = manager.Event()
+        elif shared:
+            import multiprocessing
+            self._event = multiprocessing.Event()
+        else:
+            self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        if self._event.is_set():
+            raise ConversionCancelled()
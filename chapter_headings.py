@@ -0,0 +1,159 @@
+import re
+from functools import lru_cache
+
+# 기본 챕터 제목 형식:
+# - # Chapter 1, ## 제목
+# - 제1화, 제 1 화, 제1장, 제 1 장
+# - 1화, 1장 (숫자로 시작)
+# - Chapter 1, CHAPTER 1
+# - Episode 1, EP.1, ep 1
+# - 프롤로그, 에필로그
+# - Part 1, PART 1
+DEFAULT_HEADING = (
+    r"(?:#+ .+)|"                                    # Markdown headers
+    r"(?:제\s*\d+\s*[화장편부](?:\s*.+)?)|"           # 제1화, 제 1 장, 제1부
+    r"(?:\d+\s*[화장편부](?:\s*.+)?)|"               # 1화, 1장
+    r"(?:Chapter\s*\d+(?:\s*.+)?)|"                  # Chapter 1
+    r"(?:Episode\s*\d+(?:\s*.+)?)|"                  # Episode 1
+    r"(?:EP\.?\s*\d+(?:\s*.+)?)|"                    # EP.1, EP 1
+    r"(?:Part\s*\d+(?:\s*.+)?)|"                     # Part 1
+    r"(?:프롤로그|에필로그|서장|종장|막간)(?:\s*.+)?" # Korean chapter markers
+)
+DEFAULT_PATTERN = re.compile(r"^(" + DEFAULT_HEADING + r")$", flags=re.MULTILINE | re.IGNORECASE)
+
+# DEFAULT_PATTERN에 매치될 수 있는 줄의 시작 (첫 글자, 한국어 표지는 앞 두 글자)
+DEFAULT_PREFIXES = [r"[#\dcep제]", "프롤", "에필", "서장", "종장", "막간"]
+
+# 사용자 형식에서 숫자 자리
+NUMBER_FIELD = "{n}"
+
+# 제목이 아닌 후보 줄이 이만큼 연달아 나왔을 때, 그 사이 평균 간격(글자)이 DENSE_CANDIDATE_GAP보다
+# 짧으면 후보 줄마다 패턴을 맞춰 보는 것보다 정규식 하나로 훑는 편이 빠르다
+DENSE_CANDIDATE_CHECK = 16
+DENSE_CANDIDATE_GAP = 128
+
+
+class HeadingDetector:
+    """
+    챕터 제목 줄 탐색기. re.Pattern처럼 search/finditer로 쓸 수 있다.
+    줄 시작 글자로 후보 줄만 빠르게 고른 뒤 (줄바꿈 문자 검색은 정규식 엔진의 고속 경로를 탄다)
+    후보 줄에서만 전체 패턴을 맞춰 본다. 매치 결과는 기본 패턴을 그대로 쓸 때와 같다.
+    "제가", "3일 뒤", 영어 문장처럼 후보이지만 제목이 아닌 줄이 촘촘하면
+    모든 형식을 합친 정규식 하나로 나머지를 찾는다 (결과는 같음).
+    patterns: 사용자 제목 형식 목록 (compile_heading 참고). 기본 형식보다 뒤에 시도한다.
+    """
+
+    def __init__(self, patterns=()):
+        self.patterns = tuple(patterns)
+        self._matchers = [DEFAULT_PATTERN]
+        prefixes = list(DEFAULT_PREFIXES)
+        bodies = [DEFAULT_HEADING]
+        for template in self.patterns:
+            self._matchers.append(compile_heading(template))
+            prefixes.append(_first_char(template))
+            bodies.append(_heading_body(template))
+        self._candidates = re.compile(r"\n(?:" + "|".join(prefixes) + ")", re.IGNORECASE)
+        # 같은 위치에서는 기본 형식, 사용자 형식 순서로 시도하는 것도 _match_at과 같음
+        self._combined = DEFAULT_PATTERN if not self.patterns else re.compile(
+            r"^(" + "|".join(bodies) + r")$", re.MULTILINE | re.IGNORECASE)
+
+    def search(self, text, pos=0):
+        """pos 이후 첫 제목 줄의 re.Match (없으면 None)"""
+        match, dense_pos = self._scan(text, pos)
+        if dense_pos is not None:
+            return self._combined.search(text, dense_pos)
+        return match
+
+    def finditer(self, text):
+        pos = 0
+        while True:
+            match, dense_pos = self._scan(text, pos)
+            if dense_pos is not None:
+                # 후보 줄이 촘촘한 원고는 나머지를 정규식 하나로 찾음
+                yield from self._combined.finditer(text, dense_pos)
+                return
+            if not match:
+                return
+            yield match
+            pos = match.end()
+
+    def _scan(self, text, pos):
+        """
+        후보 줄만 맞춰 보며 pos 이후 첫 제목 줄을 찾아 (match, None)을 반환.
+        후보 줄이 촘촘하면 찾기를 멈추고 (None, 이어서 찾을 위치)를 반환
+        """
+        if pos == 0 or text[pos - 1:pos] == "\n":
+            match = self._match_at(text, pos)
+            if match:
+                return match, None
+        candidates = self._candidates
+        start = pos
+        misses = 0
+        while True:
+            candidate = candidates.search(text, pos)
+            if not candidate:
+                return None, None
+            pos = candidate.start() + 1
+            match = self._match_at(text, pos)
+            if match:
+                return match, None
+            misses += 1
+            if misses == DENSE_CANDIDATE_CHECK:
+                if pos - start < DENSE_CANDIDATE_CHECK * DENSE_CANDIDATE_GAP:
+                    return None, pos
+                start = pos
+                misses = 0
+
+    def _match_at(self, text, pos):
+        for matcher in self._matchers:
+            match = matcher.match(text, pos)
+            if match:
+                return match
+        return None
+
+
+def compile_heading(template):
+    """
+    사용자 제목 형식을 정규식으로 변환.
+    {n}은 숫자, 공백은 0개 이상의 공백/탭에 대응하고, 뒤에 부제가 붙어도 제목으로 본다.
+    대소문자는 구분하지 않는다. 예: "【{n}화】", "#{n}.", "Ch. {n}"
+    """
+    return re.compile(r"^(" + _heading_body(template) + r")$", re.MULTILINE | re.IGNORECASE)
+
+
+def _heading_body(template):
+    template = template.strip()
+    if not template.replace(NUMBER_FIELD, "").strip():
+        raise ValueError(f"제목 형식에는 {NUMBER_FIELD} 외의 글자가 있어야 합니다: '{template}'")
+    parts = []
+    for i, literal in enumerate(template.split(NUMBER_FIELD)):
+        if i:
+            parts.append(r"\d+")
+        parts.append(r"[ \t]*".join(re.escape(word) for word in literal.split()))
+    # 부제가 다음 줄로 넘어가지 않도록 한 줄 안에서만 매치 (스트리밍 분할의 미리 읽기 범위 유지)
+    return r"[ \t]*".join(part for part in parts if part) + r".*"
+
+
+def _first_char(template):
+    template = template.strip()
+    if template.startswith(NUMBER_FIELD):
+        return r"\d"
+    return re.escape(template[0])
+
+
+@lru_cache(maxsize=16)
+def _cached_detector(patterns):
+    return HeadingDetector(patterns)
+
+
+def get_detector(patterns=None):
+    """
+    제목 형식 목록에 대한 HeadingDetector. 같은 목록이면 한 번 컴파일한 것을 재사용한다.
+    빈 항목은 무시하고, 숫자 자리만 있는 형식이면 ValueError.
+    """
+    return _cached_detector(tuple(p.strip() for p in patterns or () if p.strip()))
+
+
+def parse_patterns(text):
+    """설정에 저장하는 여러 줄 문자열 → 제목 형식 목록"""
+    return [line.strip() for line in (text or "").splitlines() if line.strip()]
@@ -0,0 +1,328 @@
+import os
+import json
+import time
+import uuid
+import signal
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+from batch_convert import convert_in_worker, init_worker, new_result
+from cancellation import CancelToken
+
+# 작업 요청에서 받는 convert_file 인자 (input_path, output_path는 필수)
+JOB_FIELDS = {
+    'input_path', 'output_path', 'title', 'author', 'metadata', 'line_height',
+    'streaming', 'incremental', 'compression', 'cache_size', 'heading_patterns', 'part_size',
+}
+METADATA_FIELDS = {'publisher', 'series', 'series_num', 'cover'}
+
+
+class QueueFull(Exception):
+    """대기/진행 중인 작업이 max_queue에 도달함"""
+
+
+class ServiceDraining(Exception):
+    """종료 중이라 새 작업을 받지 않음"""
+
+
+class ConversionService:
+    """
+    워커 프로세스를 띄워 둔 채 변환 작업을 받는 작업 큐 (HTTP 처리와는 분리).
+    워커는 시작할 때 추출/EPUB 라이브러리를 미리 불러 두므로 작업마다 인터프리터 시작과
+    import 비용을 내지 않는다. 작업 결과는 convert_file 결과 dict (단계별 측정값 포함).
+    max_queue: 끝나지 않은 작업(대기+진행) 수 한도, max_history: 보관할 끝난 작업 수
+    """
+
+    def __init__(self, workers=0, max_queue=100, max_history=1000):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.max_history = max_history
+        self.cancel_token = CancelToken(shared=True)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                        initargs=(self.cancel_token, True))
+        self.jobs = OrderedDict()   # 작업 id -> 상태 dict (제출 순서)
+        self.futures = {}           # 끝나지 않은 작업 id -> Future
+        self.draining = False
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    def submit(self, request):
+        """작업 요청 dict를 큐에 넣고 상태를 반환. 잘못된 요청이면 ValueError"""
+        job_args = _job_args(request)
+        with self._lock:
+            if self.draining:
+                raise ServiceDraining("Service is shutting down")
+            if len(self.futures) >= self.max_queue:
+                raise QueueFull(f"Queue is full ({self.max_queue} jobs)")
+            job_id = uuid.uuid4().hex
+            self.jobs[job_id] = {
+                'id': job_id,
+                'status': 'queued',
+                'input': job_args['input_path'],
+                'output': job_args['output_path'],
+                'submitted': time.time(),
+                'finished': None,
+                'result': None,
+            }
+            future = self.pool.submit(convert_in_worker, job_args)
+            self.futures[job_id] = future
+            self._prune()
+        future.add_done_callback(lambda f: self._finish(job_id, f))
+        return self.status(job_id)
+
+    def status(self, job_id):
+        """작업 상태 dict 사본 (queued, running, done, failed, cancelled). 없으면 None"""
+        with self._lock:
+            return self._status(job_id)
+
+    def list_jobs(self):
+        with self._lock:
+            return [self._status(job_id) for job_id in self.jobs]
+
+    def summary(self):
+        with self._lock:
+            counts = {}
+            for job_id in self.jobs:
+                status = self._status(job_id)['status']
+                counts[status] = counts.get(status, 0) + 1
+            return {
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'draining': self.draining,
+                'jobs': counts,
+            }
+
+    def cancel(self, job_id):
+        """
+        아직 시작하지 않은 작업을 취소. 취소했으면 True,
+        이미 시작했거나 끝났으면 False, 없는 작업이면 KeyError
+        """
+        with self._lock:
+            if job_id not in self.jobs:
+                raise KeyError(job_id)
+            future = self.futures.get(job_id)
+        # 취소되면 done 콜백(_finish)이 잠금을 잡으므로 잠금 밖에서 호출
+        return future is not None and future.cancel()
+
+    def drain(self, force=None):
+        """
+        새 작업을 받지 않고 대기/진행 중인 작업이 모두 끝날 때까지 기다린 뒤 워커를 종료.
+        force(threading.Event)가 설정되면 기다리지 않고 진행 중인 작업도 취소한다.
+        """
+        with self._lock:
+            self.draining = True
+            while self.futures and not (force is not None and force.is_set()):
+                self._idle.wait(0.5)
+            forced = bool(self.futures)
+        if forced:
+            self.cancel_token.cancel()
+        self.pool.shutdown(wait=True, cancel_futures=forced)
+
+    def _status(self, job_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        job = dict(job)
+        # 프로세스 풀은 워커 수보다 하나 더 많은 작업을 미리 넘겨 두므로 그 작업도 running으로 보임
+        future = self.futures.get(job_id)
+        if future is not None and future.running():
+            job['status'] = 'running'
+        return job
+
+    def _finish(self, job_id, future):
+        if future.cancelled():
+            result = None
+        else:
+            try:
+                result = future.result()
+            except Exception as e:
+                # 워커 프로세스가 비정상 종료된 경우 등
+                with self._lock:
+                    job = self.jobs[job_id]
+                result = new_result(job['input'], job['output'])
+                result['error'] = str(e) or type(e).__name__
+        with self._lock:
+            job = self.jobs[job_id]
+            if result is None or result['cancelled']:
+                job['status'] = 'cancelled'
+            else:
+                job['status'] = 'done' if result['success'] else 'failed'
+            job['result'] = result
+            job['finished'] = time.time()
+            del self.futures[job_id]
+            self._idle.notify_all()
+
+    def _prune(self):
+        # 오래된 끝난 작업부터 지워 보관 개수를 제한 (진행 중인 작업은 남김)
+        excess = len(self.jobs) - self.max_history
+        for job_id in list(self.jobs):
+            if excess <= 0:
+                break
+            if job_id not in self.futures:
+                del self.jobs[job_id]
+                excess -= 1
+
+
+def _job_args(request):
+    """요청 JSON → convert_file 인자 (단계별 측정값은 항상 기록)"""
+    if not isinstance(request, dict):
+        raise ValueError("Request body must be a JSON object")
+    unknown = set(request) - JOB_FIELDS - {'cover'}
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    for key in ('input_path', 'output_path'):
+        if not isinstance(request.get(key), str) or not request[key]:
+            raise ValueError(f"'{key}' is required")
+    if not os.path.isfile(request['input_path']):
+        raise ValueError(f"Input file not found: {request['input_path']}")
+
+    job = {key: value for key, value in request.items() if key in JOB_FIELDS}
+    metadata = dict(job.get('metadata') or {})
+    unknown = set(metadata) - METADATA_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown metadata fields: {', '.join(sorted(unknown))}")
+    if request.get('cover'):
+        metadata['cover'] = request['cover']
+    if metadata.get('cover') and not os.path.isfile(metadata['cover']):
+        raise ValueError(f"Cover image not found: {metadata['cover']}")
+    job['metadata'] = metadata
+    job['stats'] = True
+    return job
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET /health, GET /jobs, GET /jobs/<id>, POST /jobs, DELETE /jobs/<id>, POST /shutdown
+    (요청/응답 본문은 JSON)
+    """
+
+    server_version = "EPUBGenerator"
+
+    def do_GET(self):
+        service = self.server.service
+        path = self.path.rstrip("/")
+        if path == "/health":
+            self._send(200, service.summary())
+        elif path == "/jobs":
+            self._send(200, {'jobs': service.list_jobs()})
+        elif path.startswith("/jobs/"):
+            job = service.status(path[len("/jobs/"):])
+            if job is None:
+                self._send(404, {'error': "Job not found"})
+            else:
+                self._send(200, job)
+        else:
+            self._send(404, {'error': "Not found"})
+
+    def do_POST(self):
+        path = self.path.rstrip("/")
+        if path == "/shutdown":
+            self.server.stop_requested.set()
+            self._send(202, {'draining': True})
+            return
+        if path != "/jobs":
+            self._send(404, {'error': "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"null")
+            self._send(202, self.server.service.submit(request))
+        except ValueError as e:
+            # json.JSONDecodeError도 ValueError
+            self._send(400, {'error': str(e)})
+        except QueueFull as e:
+            self._send(429, {'error': str(e)})
+        except ServiceDraining as e:
+            self._send(503, {'error': str(e)})
+
+    def do_DELETE(self):
+        path = self.path.rstrip("/")
+        if not path.startswith("/jobs/"):
+            self._send(404, {'error': "Not found"})
+            return
+        try:
+            cancelled = self.server.service.cancel(path[len("/jobs/"):])
+        except KeyError:
+            self._send(404, {'error': "Job not found"})
+            return
+        if cancelled:
+            self._send(200, {'cancelled': True})
+        else:
+            self._send(409, {'error': "Job has already started or finished"})
+
+    def address_string(self):
+        # Unix 소켓에서는 client_address가 빈 문자열
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "local"
+
+    def _send(self, code, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(service, host="127.0.0.1", port=8765, socket_path=None):
+    """HTTP 서버 생성 (socket_path를 주면 TCP 대신 Unix 소켓)"""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixHTTPServer(socket_path, ServiceRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ServiceRequestHandler)
+    server.service = service
+    server.stop_requested = threading.Event()
+    return server
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Run a local EPUB conversion service with warm workers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Worker processes (0 = all cores)")
+    parser.add_argument("--max-queue", type=int, default=100,
+                        help="Maximum queued + running jobs before new jobs get HTTP 429")
+    parser.add_argument("--max-history", type=int, default=1000,
+                        help="Finished jobs kept for status queries")
+    args = parser.parse_args()
+
+    service = ConversionService(args.workers, args.max_queue, args.max_history)
+    server = make_server(service, args.host, args.port, args.socket)
+    force = threading.Event()
+
+    def on_signal(signum, frame):
+        # 첫 신호: 새 작업을 막고 남은 작업을 마침, 두 번째 신호: 진행 중인 작업도 취소
+        if server.stop_requested.is_set():
+            force.set()
+        server.stop_requested.set()
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"Serving on {where} with {service.workers} workers (Ctrl+C to drain and stop)")
+
+    server.stop_requested.wait()
+    print("Draining: finishing queued jobs (press Ctrl+C again to cancel them)")
+    service.drain(force)
+    server.shutdown()
+    server.server_close()
+    if args.socket and os.path.exists(args.socket):
+        os.remove(args.socket)
+    print("Stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 보고서 출력 순서
+STAGES = ["extract", "split", "render", "write"]
+
+
+class ConversionObserver:
+    """
+    변환 단계 이벤트를 받는 observer 기본 클래스. 필요한 메서드만 재정의하면 된다.
+    단계는 중첩될 수 있고 (예: 스트리밍 변환에서 render 도중 extract/split),
+    seconds는 하위 단계를 포함한 시간이다.
+    counters: 'bytes_in', 'bytes_out', 'chars_in', 'chars_out', 'chapters', 'paragraphs' 등
+              (split 단계는 원고의 'words', 'chars'(공백 제외), 'hangul'도 보고)
+    """
+
+    def stage_started(self, stage):
+        pass
+
+    def stage_finished(self, stage, seconds, counters):
+        pass
+
+    def progress(self, stage, done, total=None):
+        """
+        단계 안의 진행 상황 (extract: TXT 바이트/PDF 페이지/HWPX 섹션, render: 챕터,
+        write: 스트리밍 생성기가 기록한 챕터).
+        total을 모르면 None (스트리밍 변환의 챕터 수 등)
+        """
+        pass
+
+
+@contextmanager
+def stage(observer, name):
+    """
+    with stage(observer, "split") as counters: ... 형태로 단계를 측정.
+    블록 안에서 counters dict에 값을 넣으면 종료 이벤트와 함께 전달된다.
+    observer가 None이면 아무것도 하지 않는다.
+    """
+    counters = {}
+    if observer is None:
+        yield counters
+        return
+    observer.stage_started(name)
+    started = time.perf_counter()
+    try:
+        yield counters
+    finally:
+        observer.stage_finished(name, time.perf_counter() - started, counters)
+
+
+class ProgressReporter(ConversionObserver):
+    """
+    진행률 콜백과 취소 토큰을 변환 단계에 연결하는 observer.
+    단계 시작과 진행 보고 때마다 cancel_token을 확인해 ConversionCancelled를 발생시킨다.
+    callback(stage, done, total): 단계 시작 시 done=0, total=None으로도 호출됨
+    forward: 같은 이벤트를 함께 받을 observer (예: ConversionStats)
+    """
+
+    def __init__(self, callback=None, cancel_token=None, forward=None):
+        self.callback = callback
+        self.cancel_token = cancel_token
+        self.forward = forward
+
+    def stage_started(self, stage):
+        # 취소 확인을 먼저 해서, 시작되지 않은 단계는 forward에도 알리지 않음
+        if self.cancel_token is not None:
+            self.cancel_token.check()
+        if self.forward is not None:
+            self.forward.stage_started(stage)
+        if self.callback is not None:
+            self.callback(stage, 0, None)
+
+    def stage_finished(self, stage, seconds, counters):
+        if self.forward is not None:
+            self.forward.stage_finished(stage, seconds, counters)
+
+    def progress(self, stage, done, total=None):
+        if self.cancel_token is not None:
+            self.cancel_token.check()
+        if self.forward is not None:
+            self.forward.progress(stage, done, total)
+        if self.callback is not None:
+            self.callback(stage, done, total)
+
+
+class ConversionStats(ConversionObserver):
+    """
+    단계별 소요 시간과 카운터를 누적.
+    중첩된 단계는 하위 단계 시간을 빼고 기록하므로 단계 시간의 합이 전체 시간이 된다.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self._child_seconds = []  # 열려 있는 단계마다 하위 단계가 쓴 시간
+
+    def stage_started(self, stage):
+        self._child_seconds.append(0.0)
+
+    def stage_finished(self, stage, seconds, counters):
+        child = self._child_seconds.pop()
+        if self._child_seconds:
+            self._child_seconds[-1] += seconds
+        entry = self.stages.setdefault(stage, {'seconds': 0.0, 'calls': 0})
+        entry['seconds'] += seconds - child
+        entry['calls'] += 1
+        for key, value in counters.items():
+            entry[key] = entry.get(key, 0) + value
+
+    @property
+    def total_seconds(self):
+        return sum(entry['seconds'] for entry in self.stages.values())
+
+    def as_dict(self):
+        """프로세스 간 전달/JSON 저장용 사본"""
+        return {name: dict(entry) for name, entry in self.stages.items()}
+
+    def format_report(self):
+        return format_report(self.stages)
+
+    def write_log(self, path, label):
+        """보고서를 시각, label과 함께 로그 파일 끝에 추가"""
+        write_log(path, label, self.stages)
+
+
+def format_report(stages):
+    """단계별 시간/비율/카운터 표 (as_dict() 결과도 받음)"""
+    total = sum(entry['seconds'] for entry in stages.values()) or 1e-9
+    order = [name for name in STAGES if name in stages]
+    order += sorted(name for name in stages if name not in STAGES)
+
+    lines = [f"{'stage':<8} {'seconds':>9} {'share':>6}  counters"]
+    for name in order:
+        entry = stages[name]
+        counters = ", ".join(f"{key}={value:,}" for key, value in entry.items()
+                             if key not in ('seconds', 'calls'))
+        lines.append(f"{name:<8} {entry['seconds']:>9.3f} {entry['seconds'] / total:>6.1%}  {counters}")
+    lines.append(f"{'total':<8} {sum(entry['seconds'] for entry in stages.values()):>9.3f}")
+    return "\n".join(lines)
+
+
+def write_log(path, label, stages):
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(f"[{timestamp}] {label}\n{format_report(stages)}\n\n")
@@ -1,36 +1,50 @@
 import os
-import re
 import sys
+import json
 import uuid
-from ebooklib import epub
-from text_extractor import TextExtractor, ExtractionError
+import io
+import html
+import hashlib
+import zipfile
+import itertools
+from collections import deque
+from chapter_headings import DEFAULT_PATTERN, get_detector
+from conversion_stats import ConversionStats, stage
+from epub_writer import ROOT_DIR, EpubStreamWriter
+from manuscript import Manuscript
+from text_counts import count_text, has_words
+from text_extractor import TextExtractor, ExtractionError, require_library
 
 class EpubGenerator:
-    # Pre-compile regex for performance
-    # Supports various chapter patterns:
-    # - # Chapter 1, ## 제목
-    # - 제1화, 제 1 화, 제1장, 제 1 장
-    # - 1화, 1장 (숫자로 시작)
-    # - Chapter 1, CHAPTER 1
-    # - Episode 1, EP.1, ep 1
-    # - 프롤로그, 에필로그
-    # - Part 1, PART 1
-    CHAPTER_PATTERN = re.compile(
-        r"^("
-        r"(?:#+ .+)|"                                    # Markdown headers
-        r"(?:제\s*\d+\s*[화장편부](?:\s*.+)?)|"           # 제1화, 제 1 장, 제1부
-        r"(?:\d+\s*[화장편부](?:\s*.+)?)|"               # 1화, 1장
-        r"(?:Chapter\s*\d+(?:\s*.+)?)|"                  # Chapter 1
-        r"(?:Episode\s*\d+(?:\s*.+)?)|"                  # Episode 1
-        r"(?:EP\.?\s*\d+(?:\s*.+)?)|"                    # EP.1, EP 1
-        r"(?:Part\s*\d+(?:\s*.+)?)|"                     # Part 1
-        r"(?:프롤로그|에필로그|서장|종장|막간)(?:\s*.+)?" # Korean chapter markers
-        r")$",
-        flags=re.MULTILINE | re.IGNORECASE
-    )
-
-    def __init__(self, title, author="Unknown"):
-        self.book = epub.EpubBook()
+    # 기본 챕터 제목 형식 (chapter_headings 참고). 실제 탐색은 HeadingDetector가 맡는다
+    CHAPTER_PATTERN = DEFAULT_PATTERN
+
+    # CHAPTER_PATTERN의 \s* 는 줄바꿈을 넘어갈 수 있어서, 제목 줄 뒤로 최대
+    # 3개의 내용 줄까지 하나의 매치가 될 수 있음 (예: "제" / "1" / "화" / "부제").
+    # 스트리밍 분할 시 이만큼의 줄이 뒤따라 읽힌 위치까지만 매치를 확정함.
+    SPLIT_LOOKAHEAD_LINES = 3
+
+    # 병렬 렌더링: 이보다 작은 책은 프로세스 풀 시작 비용이 더 커서 직렬 처리
+    PARALLEL_MIN_CHARS = 1024 * 1024
+    PARALLEL_BATCH_CHARS = 256 * 1024
+
+    # 렌더링된 챕터 본문이 이보다 크면 여러 XHTML 파일로 나눔 (리더가 큰 파일을 느리게 열거나 멈춤)
+    MAX_PART_BYTES = 256 * 1024
+
+    # format_content 줄 분류표
+    SCENE_BREAKS = frozenset(["***", "---", "###", "==="])
+    PARAGRAPH_OPEN = {
+        '"': '<p class="dialogue">',
+        "'": '<p class="dialogue">',
+        '「': '<p class="dialogue">',
+        '『': '<p class="dialogue">',
+    }
+    STREAM_CHUNK_SIZE = 1024 * 1024
+    # 빠른 미리보기에서 한 번에 읽는 크기 (PDF는 이만큼 찰 때까지만 페이지를 추출)
+    PREVIEW_CHUNK_SIZE = 16 * 1024
+
+    def __init__(self, title, author="Unknown", workers=1, observer=None):
+        self.book = _epub().EpubBook()
         # UUID 사용으로 고유 식별자 보장
         self.book.set_identifier(f"urn:uuid:{uuid.uuid4()}")
         self.book.set_title(title)
@@ -38,7 +52,18 @@ class EpubGenerator:
         self.book.add_author(author)
 
         self.chapters = []
+        self.parts = []  # 챕터마다 나뉜 파일 목록 (spine 순서)
+        # 챕터 파일 최대 크기 (바이트, 0이면 나누지 않음)
+        self.max_part_bytes = self.MAX_PART_BYTES
         self.cover_image = None
+        # 챕터 렌더링 프로세스 수 (1이면 직렬, 0이면 CPU 코어 수)
+        self.workers = workers or os.cpu_count() or 1
+        # 단계별 시간/카운터를 받을 ConversionObserver (없으면 측정하지 않음)
+        self.observer = observer
+        self._render_counters = None
+        self._render_total = None
+        # 챕터 제목 탐색기 (set_heading_patterns로 사용자 형식 추가)
+        self.headings = get_detector()
         # 다양한 EPUB 리더 호환을 위한 폰트 폴백 체인
         self.style = """
             @namespace epub "http://www.idpf.org/2007/ops";
@@ -54,9 +79,9 @@ class EpubGenerator:
             .scene-break { text-align: center; margin: 2em 0; font-weight: bold; }
         """
 
-    def extract_text(self, file_path):
+    def extract_text(self, file_path, info=None):
         """Delegates to TextExtractor"""
-        return TextExtractor.extract(file_path)
+        return TextExtractor.extract(file_path, info, self.workers, self.observer)
 
     def set_cover(self, image_path):
         """표지 이미지 설정"""
@@ -70,156 +95,959 @@ class EpubGenerator:
         with open(image_path, 'rb') as f:
             image_data = f.read()
 
-        self.book.set_cover(f"cover{ext}", image_data)
+        self._set_cover_data(f"cover{ext}", image_data)
         self.cover_image = image_path
 
+    def _set_cover_data(self, file_name, image_data):
+        self.book.set_cover(file_name, image_data)
+
+    def apply_metadata(self, metadata):
+        """출판사/시리즈/표지 메타데이터 적용 (GUI, 일괄 변환 공용)"""
+        if metadata.get('publisher'):
+            self.book.add_metadata('DC', 'publisher', metadata['publisher'])
+        if metadata.get('series'):
+            self.book.add_metadata(None, 'meta', metadata['series'],
+                                   {'name': 'calibre:series'})
+            if metadata.get('series_num'):
+                self.book.add_metadata(None, 'meta', str(metadata['series_num']),
+                                       {'name': 'calibre:series_index'})
+        if metadata.get('cover'):
+            self.set_cover(metadata['cover'])
+
+    def set_line_height(self, line_height):
+        self.style = self.style.replace("line-height: 1.8", f"line-height: {line_height}")
+
+    def set_part_size(self, max_bytes):
+        """챕터 XHTML 파일 하나의 최대 본문 크기 (바이트, 0이면 나누지 않음)"""
+        self.max_part_bytes = max_bytes
+
+    def set_heading_patterns(self, patterns):
+        """기본 형식 외에 인식할 챕터 제목 형식 목록 (예: "【{n}화】", "Ch. {n}")"""
+        self.headings = get_detector(patterns)
+
+    def parse_manuscript(self, raw_text):
+        """원고를 한 번 파싱해 챕터 경계를 기록 (미리보기/변환 공용)"""
+        with stage(self.observer, "split") as counters:
+            manuscript = Manuscript.parse(raw_text, self.headings)
+            counters['chars_in'] = len(raw_text)
+            counters['chapters'] = len(manuscript)
+            if self.observer is not None:
+                # 단어/글자 수는 통계를 받을 때만 셈
+                counters.update(manuscript.counts())
+        return manuscript
+
+    def _as_manuscript(self, text):
+        return text if isinstance(text, Manuscript) else self.parse_manuscript(text)
+
     def get_chapter_preview(self, raw_text, max_chapters=10):
-        """챕터 미리보기 생성 (변환 전 확인용)"""
-        raw_text = raw_text.replace("\r\n", "\n")
-        parts = self.CHAPTER_PATTERN.split(raw_text)
+        """챕터 미리보기 생성 (변환 전 확인용). 파싱된 Manuscript도 받음"""
+        manuscript = self._as_manuscript(raw_text)
 
         preview = []
-        if len(parts) <= 1:
-            # 챕터가 없으면 전체를 하나로
-            word_count = len(raw_text.split())
+        for i in range(min(len(manuscript), max_chapters)):
+            counts = manuscript.counts(i)
             preview.append({
-                'title': 'Chapter 1',
-                'word_count': word_count,
-                'preview': raw_text[:200] + '...' if len(raw_text) > 200 else raw_text
+                'title': manuscript.title(i),
+                'word_count': counts['words'],
+                'char_count': counts['chars'],        # 공백 제외 글자 수
+                'hangul_count': counts['hangul'],
+                'preview': manuscript.snippet(i)
             })
+
+        return {
+            'total_chapters': len(manuscript),
+            'chapters': preview,
+            'total_words': manuscript.total_words,
+            'total_chars': manuscript.total_chars,
+            'total_hangul': manuscript.total_hangul
+        }
+
+    def get_quick_preview(self, file_path, max_chapters=10):
+        """
+        파일 앞부분만 읽어 만드는 미리보기 (get_chapter_preview와 같은 형식).
+        처음 max_chapters개 챕터가 확정되면 읽기를 멈춘다. 다시 읽기 쉬운 원고(TXT, 메모리에
+        추출된 DOCX/HWP)는 제목만 훑어 전체 챕터 수를 세고, 북마크가 있는 PDF는 북마크 수로 안다.
+        그 밖의 PDF/HWPX처럼 추출이 느린 원고는 남은 페이지를 읽지 않으며 'total_chapters'가 None.
+        전체 단어/글자 수('total_words' 등)는 세지 않으므로 항상 None
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        outline = TextExtractor.read_pdf_outline(file_path) if ext == ".pdf" else None
+        if outline:
+            # 앞쪽 구간만 추출하므로 PDF 추출 프로세스 풀은 띄우지 않음
+            info = {}
+            preview, total = self._preview_chapters(
+                TextExtractor.iter_pdf_chapters(file_path, outline, observer=self.observer,
+                                                info=info), max_chapters)
+            if total is None:
+                total = len(outline) + 1 if info['intro'] else len(outline)
+        elif ext == ".docx":
+            text, headings = TextExtractor.read_docx(file_path)
+            marks = self.heading_marks(headings)
+            if marks:
+                preview, _ = self._preview_chapters(self.iter_heading_chapters(text, marks),
+                                                    max_chapters)
+                total = len(marks) + 1 if has_words(text, 0, marks[0][0]) else len(marks)
+            else:
+                preview, total = self._preview_stream(io.StringIO(text), max_chapters)
         else:
-            # 서문이 있으면 추가
-            if parts[0].strip():
-                content = parts[0].strip()
-                preview.append({
-                    'title': 'Introduction',
-                    'word_count': len(content.split()),
-                    'preview': content[:200] + '...' if len(content) > 200 else content
-                })
-
-            # 각 챕터 정보
-            for i in range(1, len(parts), 2):
-                if len(preview) >= max_chapters:
-                    break
-                title = parts[i].strip()
-                content = parts[i + 1].strip() if i + 1 < len(parts) else ""
-                preview.append({
-                    'title': title,
-                    'word_count': len(content.split()),
-                    'preview': content[:200] + '...' if len(content) > 200 else content
-                })
-
-        total_chapters = (len(parts) - 1) // 2 if len(parts) > 1 else 1
-        if parts[0].strip() and len(parts) > 1:
-            total_chapters += 1
+            with TextExtractor.open_stream(file_path, observer=self.observer) as stream:
+                preview, total = self._preview_stream(stream, max_chapters)
 
         return {
-            'total_chapters': total_chapters,
+            'total_chapters': total,
             'chapters': preview,
-            'total_words': len(raw_text.split())
+            'total_words': None,
+            'total_chars': None,
+            'total_hangul': None
         }
 
-    def process_text(self, raw_text):
-        # Normalize line endings
-        raw_text = raw_text.replace("\r\n", "\n")
-        
-        # Split into chapters using pre-compiled regex
-        parts = self.CHAPTER_PATTERN.split(raw_text)
-        
-        if len(parts) <= 1:
-            # No chapters found, treat as one
-            self.add_chapter("Chapter 1", raw_text)
+    def _preview_stream(self, stream, max_chapters):
+        preview, total = self._preview_chapters(
+            self.iter_chapters(stream, self.PREVIEW_CHUNK_SIZE, self.observer, self.headings),
+            max_chapters)
+        if total is None and stream.seekable():
+            stream.seek(0)
+            total = self.count_chapters(stream, observer=self.observer, headings=self.headings)
+        return preview, total
+
+    @staticmethod
+    def _preview_chapters(chapters, max_chapters):
+        """(title, content) 챕터를 max_chapters개까지 읽어 (미리보기 목록, 끝까지 읽었으면 챕터 수)"""
+        preview = []
+        total = None
+        for title, content in chapters:
+            if not preview and title == "Introduction":
+                # Manuscript.snippet과 같이 서문은 앞뒤 공백을 빼고 보여 줌
+                snippet = content.strip()
+            else:
+                snippet = content
+            counts = count_text(content)
+            preview.append({
+                'title': title,
+                'word_count': counts['words'],
+                'char_count': counts['chars'],
+                'hangul_count': counts['hangul'],
+                'preview': snippet[:200] + '...' if len(snippet) > 200 else snippet
+            })
+            if len(preview) == max_chapters:
+                break
         else:
-            # First part might be intro/metadata
-            if parts[0].strip():
-                self.add_chapter("Introduction", parts[0])
-            
-            # parts[0] is intro, [1] is chap1 title, [2] is chap1 content, [3] is chap2 title...
-            for i in range(1, len(parts), 2):
-                title = parts[i].strip()
-                content = parts[i+1].strip() if i+1 < len(parts) else ""
-                self.add_chapter(title, content)
+            total = len(preview)
+        chapters.close()
+        return preview, total
+
+    def process_document(self, file_path, info=None):
+        """
+        문서 구조로 챕터를 나눌 수 있는 형식이면 본문에서 제목 형식을 찾지 않고 챕터로 추가.
+        - PDF: 북마크(목차)의 페이지 구간마다 추출 (workers > 1이면 구간을 병렬 추출)
+        - DOCX: 제목 스타일 문단에서 나눔 (제목 스타일이 없으면 process_text와 같이 분할)
+        추가했으면 원고 전체의 {'words', 'chars', 'hangul'}, 해당하지 않으면 None
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == ".pdf":
+            return self._process_pdf_outline(file_path, info)
+        if ext == ".docx":
+            return self._process_docx(file_path, info)
+        return None
 
-    def format_content(self, text):
-        lines = text.split("\n")
-        formatted_html = ""
-        
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
+    def _process_pdf_outline(self, file_path, info):
+        with stage(self.observer, "split") as counters:
+            outline = TextExtractor.read_pdf_outline(file_path, info)
+            counters['chapters'] = len(outline) if outline else 0
+        if not outline:
+            return None
+
+        totals = {'words': 0, 'chars': 0, 'hangul': 0}
+        has_text = False
+        chapters = TextExtractor.iter_pdf_chapters(file_path, outline, self.workers, self.observer)
+
+        def counted():
+            nonlocal has_text
+            while True:
+                with stage(self.observer, "extract") as counters:
+                    chapter = next(chapters, None)
+                    if chapter is None:
+                        return
+                    counters['chars_out'] = len(chapter[1])
+                has_text = has_text or bool(chapter[1].strip())
+                for text in chapter:
+                    for key, value in count_text(text).items():
+                        totals[key] += value
+                yield chapter
+
+        self.add_chapters(counted(), len(outline))
+        if not has_text:
+            # 북마크만 있고 본문이 이미지인 PDF
+            raise ExtractionError("PDF에서 텍스트를 추출할 수 없습니다. 이미지 기반 PDF일 수 있습니다.")
+        return totals
+
+    def _process_docx(self, file_path, info):
+        with stage(self.observer, "extract") as counters:
+            text, headings = TextExtractor.read_docx(file_path, info)
+            counters['bytes_in'] = os.path.getsize(file_path)
+            counters['chars_out'] = len(text)
+        if not text.strip():
+            raise ExtractionError("DOCX 파일이 비어있습니다.")
+
+        marks = self.heading_marks(headings)
+        if marks is None:
+            # 제목 스타일을 쓰지 않은 문서는 본문에서 제목 형식을 찾음
+            manuscript = self.parse_manuscript(text)
+            self.process_text(manuscript)
+            return manuscript.counts()
+
+        with stage(self.observer, "split") as counters:
+            totals = count_text(text)
+            counters['chars_in'] = len(text)
+            counters['chapters'] = len(marks)
+            counters.update(totals)
+        self.add_chapters(self.iter_heading_chapters(text, marks), len(marks))
+        return totals
+
+    @staticmethod
+    def heading_marks(headings):
+        """
+        제목 문단 [(단계, 시작, 끝), ...] 중 챕터를 나눌 (시작, 끝) 목록.
+        두 개 이상 있는 가장 상위 단계로 나누고, 그보다 상위인 제목도 경계로 쓴다 (부 제목 등).
+        그런 단계가 없으면 None
+        """
+        counts = {}
+        for level, _, _ in headings:
+            counts[level] = counts.get(level, 0) + 1
+        top = next((level for level in sorted(counts) if counts[level] >= 2), None)
+        if top is None:
+            return None
+        return [(start, end) for level, start, end in headings if level <= top]
+
+    @staticmethod
+    def iter_heading_chapters(text, marks):
+        """
+        heading_marks의 제목 위치에서 text를 (title, content) 챕터로 나눔.
+        하위 단계의 제목 문단은 본문에 남고, 첫 제목 앞에 글이 있으면 "Introduction" 챕터가 먼저 나온다.
+        """
+        if has_words(text, 0, marks[0][0]):
+            yield "Introduction", text[:marks[0][0]]
+        for i, (start, end) in enumerate(marks):
+            stop = marks[i + 1][0] if i + 1 < len(marks) else len(text)
+            # 제목 문단 안의 줄바꿈은 공백으로
+            yield " ".join(text[start:end].split()), text[end:stop].strip()
+
+    def process_text(self, raw_text):
+        """원고 텍스트(또는 get_chapter_preview에 쓴 Manuscript)를 챕터로 추가"""
+        manuscript = self._as_manuscript(raw_text)
+        return self.add_chapters(manuscript.iter_chapters(), len(manuscript))
+
+    @classmethod
+    def iter_chapters(cls, stream, chunk_size=None, observer=None, headings=None):
+        """
+        텍스트 스트림을 청크 단위로 읽으며 (title, content) 챕터를 하나씩 생성.
+        process_text와 같은 챕터 경계를 찾지만 원고 전체를 메모리에 올리지 않음.
+        observer: 스트림 읽기는 "extract", 경계 탐색은 "split" 단계로 보고
+        headings: HeadingDetector (없으면 기본 형식만 인식)
+        """
+        chunk_size = chunk_size or cls.STREAM_CHUNK_SIZE
+        pattern = headings or get_detector()
+
+        title = None      # None이면 아직 첫 제목을 찾지 못한 상태 (서문)
+        body = []         # 현재 챕터 본문 중 확정된 조각들
+        pending = ""      # 매치 여부가 아직 확정되지 않은 꼬리 부분
+        carry = ""        # 청크 경계에서 잘린 미완성 줄
+        eof = False
+
+        while not eof:
+            with stage(observer, "extract") as counters:
+                chunk = stream.read(chunk_size)
+                counters['chars_out'] = len(chunk)
+            if chunk:
+                data = carry + chunk
+                cut = data.rfind("\n") + 1
+                if not cut:
+                    carry = data
+                    continue
+                piece, carry = data[:cut], data[cut:]
+            else:
+                eof = True
+                piece, carry = carry, ""
+
+            # 측정 구간에 소비자 쪽 시간이 섞이지 않도록 청크의 챕터를 모아서 내보냄
+            ready = []
+            with stage(observer, "split") as counters:
+                window = pending + piece.replace("\r\n", "\n")
+                safe = len(window) if eof else cls._split_safe_offset(window)
+
+                pos = 0
+                while True:
+                    match = pattern.search(window, pos)
+                    if not match or match.start() >= safe:
+                        break
+                    body.append(window[pos:match.start()])
+                    content = "".join(body)
+                    if title is not None:
+                        ready.append((title.strip(), content.strip()))
+                    elif content.strip():
+                        ready.append(("Introduction", content))
+                    title = match.group(1)
+                    body = []
+                    pos = match.end()
+
+                cut = max(safe, pos)
+                body.append(window[pos:cut])
+                pending = window[cut:]
+
+                if eof:
+                    content = "".join(body)
+                    if title is None:
+                        # No chapters found, treat as one (빈 원고면 아무것도 생성하지 않음)
+                        if content.strip():
+                            ready.append(("Chapter 1", content))
+                    else:
+                        ready.append((title.strip(), content.strip()))
+                counters['chars_in'] = len(piece)
+                counters['chapters'] = len(ready)
+                if observer is not None:
+                    # 조각은 줄 단위로 끊기므로 조각마다 따로 세어도 합이 원고 전체와 같음
+                    counters.update(count_text(piece))
+            yield from ready
+
+    @classmethod
+    def count_chapters(cls, stream, chunk_size=None, observer=None, headings=None):
+        """
+        iter_chapters가 만들 챕터 수. 같은 경계를 찾지만 제목만 세고 본문은 모으지 않음
+        """
+        chunk_size = chunk_size or cls.STREAM_CHUNK_SIZE
+        pattern = headings or get_detector()
+
+        found = 0           # 확정된 제목 수
+        has_text = False    # 첫 제목 앞(제목이 없으면 원고 전체)에 글자가 있는지
+        pending = ""
+        carry = ""
+        eof = False
+
+        while not eof:
+            with stage(observer, "extract") as counters:
+                chunk = stream.read(chunk_size)
+                counters['chars_out'] = len(chunk)
+            if chunk:
+                data = carry + chunk
+                cut = data.rfind("\n") + 1
+                if not cut:
+                    carry = data
+                    continue
+                piece, carry = data[:cut], data[cut:]
+            else:
+                eof = True
+                piece, carry = carry, ""
+
+            with stage(observer, "split") as counters:
+                window = pending + piece.replace("\r\n", "\n")
+                safe = len(window) if eof else cls._split_safe_offset(window)
+
+                pos = 0
+                while True:
+                    match = pattern.search(window, pos)
+                    if not match or match.start() >= safe:
+                        break
+                    if not found:
+                        has_text = has_text or has_words(window, pos, match.start())
+                    found += 1
+                    pos = match.end()
+
+                cut = max(safe, pos)
+                if not found:
+                    has_text = has_text or has_words(window, pos, cut)
+                pending = window[cut:]
+                counters['chars_in'] = len(piece)
+
+        # 제목 앞의 서문은 "Introduction", 제목이 없는 원고는 "Chapter 1" 하나
+        return found + 1 if has_text else found
+
+    @classmethod
+    def _split_safe_offset(cls, window):
+        """매치 시작 위치로 확정할 수 있는 경계 (뒤에서 N번째 내용 줄의 시작)"""
+        end = len(window)
+        remaining = cls.SPLIT_LOOKAHEAD_LINES
+        while end > 0:
+            start = window.rfind("\n", 0, end - 1) + 1
+            if window[start:end].strip():
+                remaining -= 1
+                if not remaining:
+                    return start
+            end = start
+        return 0
+
+    def process_stream(self, stream, chunk_size=None):
+        """스트림에서 챕터를 읽어 추가. 추가된 챕터 수를 반환 (빈 원고면 0)"""
+        return self.add_chapters(self.iter_chapters(stream, chunk_size, self.observer,
+                                                     self.headings))
+
+    @classmethod
+    def format_content(cls, text):
+        # 한 번의 join으로 조립 (문자열 += 누적은 긴 챕터에서 이차 시간)
+        out = []
+        append = out.append
+        scene_breaks = cls.SCENE_BREAKS
+        paragraph_open = cls.PARAGRAPH_OPEN
+
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line:
                 continue
-            
-            # Scene break detection
-            if line_stripped in ["***", "---", "###", "==="]:
-                formatted_html += '<p class="scene-break">***</p>'
-            elif line_stripped.startswith('"') or line_stripped.startswith("'") or line_stripped.startswith('「') or line_stripped.startswith('『'):
-                # Dialogue: no indent
-                formatted_html += f'<p class="dialogue">{line_stripped}</p>'
+
+            if line in scene_breaks:
+                append('<p class="scene-break">***</p>')
             else:
-                # Narrative: default indent
-                formatted_html += f"<p>{line_stripped}</p>"
-        
-        return formatted_html
+                # 첫 글자로 대사/서술 구분 (대사는 들여쓰기 없음)
+                append(paragraph_open.get(line[0], "<p>"))
+                append(line)
+                append("</p>")
+
+        return "".join(out)
+
+    @classmethod
+    def render_chapter(cls, title, content):
+        """챕터 본문 HTML 생성 (부작용 없음, 워커 프로세스에서도 호출됨)"""
+        return f"<h1>{title}</h1>" + cls.format_content(content)
+
+    @classmethod
+    def split_rendered(cls, html_content, max_bytes):
+        """
+        렌더링된 챕터 본문을 UTF-8 기준 max_bytes 이하의 조각들로 나눔.
+        문단(</p>) 경계에서 자르고, 조각의 절반을 넘긴 뒤에 장면 전환(***)이 있으면
+        그 앞에서 자른다. 문단 하나가 max_bytes보다 크면 그 문단만으로 한 조각이 된다.
+        """
+        # UTF-8은 글자당 최대 4바이트이므로 확실히 작은 챕터는 인코딩하지 않고 통과
+        if not max_bytes or len(html_content) * 4 <= max_bytes:
+            return [html_content]
+
+        parts = []
+        start = 0           # 현재 조각의 시작 위치
+        size = 0            # 현재 조각의 바이트 수
+        scene_cut = None    # 현재 조각 안의 마지막 장면 전환 (위치, 그 앞까지의 바이트 수)
+        pos = 0
+        while pos < len(html_content):
+            end = html_content.find("</p>", pos)
+            end = len(html_content) if end < 0 else end + 4
+            piece = len(html_content[pos:end].encode("utf-8"))
+            while size + piece > max_bytes and pos > start:
+                cut, cut_size = pos, size
+                if scene_cut and scene_cut[1] * 2 >= max_bytes:
+                    cut, cut_size = scene_cut
+                parts.append(html_content[start:cut])
+                start = cut
+                size -= cut_size
+                scene_cut = None
+            if html_content.startswith('<p class="scene-break">', pos) and pos > start:
+                scene_cut = (pos, size)
+            size += piece
+            pos = end
+        parts.append(html_content[start:])
+        return parts
 
     def add_chapter(self, title, content):
+        html_content = self.render_chapter(title, content)
+        self._count_rendered(html_content)
+        self._add_rendered_chapter(title, html_content)
+
+    def _count_rendered(self, html_content):
+        # add_chapters 측정 중일 때만 문단 수/출력 크기 집계와 챕터 진행률 보고
+        counters = self._render_counters
+        if counters is not None:
+            counters['paragraphs'] = counters.get('paragraphs', 0) + html_content.count("<p")
+            counters['chars_out'] = counters.get('chars_out', 0) + len(html_content)
+            counters['chapters'] = counters.get('chapters', 0) + 1
+            self.observer.progress("render", counters['chapters'], self._render_total)
+
+    def _add_rendered_chapter(self, title, html_content):
         index = len(self.chapters) + 1
-        file_name = f"chap_{index:03d}.xhtml"
-        
-        chapter = epub.EpubHtml(title=title, file_name=file_name, lang="ko")
-        
-        html_content = f"<h1>{title}</h1>"
-        html_content += self.format_content(content)
-        
-        # Link CSS
-        chapter.add_link(href="style/main.css", rel="stylesheet", type="text/css")
-        
-        chapter.content = f'<html><head><meta charset="UTF-8"/></head><body>{html_content}</body></html>'
-        
-        self.book.add_item(chapter)
-        self.chapters.append(chapter)
+        parts = []
+        for part, body in enumerate(self.split_rendered(html_content, self.max_part_bytes), 1):
+            # 나뉜 뒷부분은 chap_001_2.xhtml처럼 이어지는 파일로 (목차는 첫 파일만 가리킴)
+            file_name = f"chap_{index:03d}.xhtml" if part == 1 else f"chap_{index:03d}_{part}.xhtml"
+
+            chapter = _epub().EpubHtml(title=title, file_name=file_name, lang="ko")
+
+            # Link CSS
+            chapter.add_link(href="style/main.css", rel="stylesheet", type="text/css")
+
+            chapter.content = f'<html><head><meta charset="UTF-8"/></head><body>{body}</body></html>'
+
+            self.book.add_item(chapter)
+            parts.append(chapter)
+        self.chapters.append(parts[0])
+        self.parts.append(parts)
+
+    def add_chapters(self, chapters, total=None):
+        """
+        (title, content) 챕터들을 순서대로 추가하고 추가한 수를 반환.
+        workers > 1이고 분량이 충분하면 프로세스 풀에서 렌더링한다.
+        total: 챕터 수를 알면 진행률 보고에 사용 (observer가 있을 때)
+        """
+        with stage(self.observer, "render") as counters:
+            self._render_counters = counters if self.observer else None
+            self._render_total = total
+            try:
+                added = self._add_chapters(chapters)
+            finally:
+                self._render_counters = None
+            counters['chapters'] = added
+        return added
+
+    def _add_chapters(self, chapters):
+        chapters = iter(chapters)
+        if self.workers > 1:
+            # 최소 분량이 모일 때까지 먼저 읽어 보고, 작은 책이면 직렬 처리
+            head = []
+            size = 0
+            for chapter in chapters:
+                head.append(chapter)
+                size += len(chapter[1])
+                if size >= self.PARALLEL_MIN_CHARS:
+                    return self._add_chapters_parallel(itertools.chain(head, chapters))
+            chapters = head
+
+        added = 0
+        for title, content in chapters:
+            self.add_chapter(title, content)
+            added += 1
+        return added
+
+    def _add_chapters_parallel(self, chapters):
+        from concurrent.futures import ProcessPoolExecutor
+
+        # 배치 단위로 워커에 보내고, 제출 순서대로 결과를 받아 번호/목차/spine 순서를 유지
+        added = 0
+        in_flight = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            try:
+                for batch in self._iter_batches(chapters):
+                    titles = [title for title, _ in batch]
+                    in_flight.append((titles, pool.submit(_render_batch, type(self), batch)))
+                    # 동시에 대기하는 배치 수를 제한해 메모리 사용량을 묶어 둠
+                    if len(in_flight) >= self.workers * 2:
+                        added += self._collect_batch(*in_flight.popleft())
+                while in_flight:
+                    added += self._collect_batch(*in_flight.popleft())
+            except BaseException:
+                # 취소/오류 시 아직 시작하지 않은 배치는 버림
+                pool.shutdown(cancel_futures=True)
+                raise
+        return added
+
+    def _collect_batch(self, titles, future):
+        for title, html_content in zip(titles, future.result()):
+            self._count_rendered(html_content)
+            self._add_rendered_chapter(title, html_content)
+        return len(titles)
+
+    def _iter_batches(self, chapters):
+        batch = []
+        size = 0
+        for chapter in chapters:
+            batch.append(chapter)
+            size += len(chapter[1])
+            if size >= self.PARALLEL_BATCH_CHARS:
+                yield batch
+                batch = []
+                size = 0
+        if batch:
+            yield batch
 
     def generate(self, output_path):
-        # Set TOC, Spine, etc.
-        self.book.toc = tuple(self.chapters)
-        
-        # Add basic structure
-        self.book.add_item(epub.EpubNcx())
-        self.book.add_item(epub.EpubNav())
-        
-        # Define CSS file
-        style_item = epub.EpubItem(uid="style_main", file_name="style/main.css", media_type="text/css", content=self.style)
-        self.book.add_item(style_item)
-        
-        # Add default spine
-        self.book.spine = ["nav"] + self.chapters
-        
-        # Write to file
-        epub.write_epub(output_path, self.book, {})
+        epub = _epub()
+        with stage(self.observer, "write") as counters:
+            # Set TOC, Spine, etc.
+            self.book.toc = tuple(self.chapters)
+
+            # Add basic structure
+            self.book.add_item(epub.EpubNcx())
+            self.book.add_item(epub.EpubNav())
+
+            # Define CSS file
+            style_item = epub.EpubItem(uid="style_main", file_name="style/main.css", media_type="text/css", content=self.style)
+            self.book.add_item(style_item)
+
+            # Add default spine
+            self.book.spine = ["nav"] + [item for parts in self.parts for item in parts]
+
+            # Write to file (ebooklib의 XHTML 처리와 zip 기록이 함께 측정됨)
+            try:
+                epub.write_epub(output_path, self.book, {})
+            except BaseException:
+                # 기록 도중 실패하면 불완전한 파일을 남기지 않음
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+                raise
+            counters['chapters'] = len(self.chapters)
+            counters['files'] = sum(len(parts) for parts in self.parts)
+            counters['bytes_out'] = os.path.getsize(output_path)
         print(f"Successfully generated: {output_path}")
 
-if __name__ == "__main__":
+def _epub():
+    # ebooklib은 lxml까지 불러와 무거우므로 EPUB을 처음 만들 때 import
+    return require_library("ebooklib.epub", "ebooklib")
+
+
+def _render_batch(generator_cls, batch):
+    """워커 프로세스에서 챕터 묶음을 렌더링"""
+    return [generator_cls.render_chapter(title, content) for title, content in batch]
+
+
+class StreamingEpubGenerator(EpubGenerator):
+    """
+    챕터를 렌더링하는 즉시 EPUB(zip)에 기록하는 생성기.
+    EpubHtml 객체를 모아 두지 않으므로 챕터가 수천 개인 책도
+    메모리에는 챕터 하나와 목차 정보만 남는다.
+    메타데이터는 EpubGenerator와 같이 self.book에 설정하면 된다.
+    """
+
+    def __init__(self, title, output_path, author="Unknown", workers=1, observer=None):
+        super().__init__(title, author, workers, observer)
+        self.output_path = output_path
+        self.writer = None
+        self.cover = None  # (file_name, image_data)
+        self.compression = "default"
+        self.zip_threads = 1
+
+    def set_compression(self, compression, threads=1):
+        """
+        zip 압축 수준 (store, fast, default, max)과 압축 스레드 수 (0이면 CPU 코어 수).
+        첫 챕터를 추가하기 전에 호출해야 한다.
+        """
+        self.compression = compression
+        self.zip_threads = threads or os.cpu_count() or 1
+
+    def _open_writer(self):
+        # 스타일 변경(줄 간격 등)이 반영되도록 첫 챕터를 쓸 때 파일을 연다
+        if self.writer is None:
+            self.writer = EpubStreamWriter(self._writer_path(), self.book.language,
+                                           self.compression, self.zip_threads)
+            self.writer.write_item("style_main", "style/main.css", self.style.encode("utf-8"), "text/css")
+        return self.writer
+
+    def _writer_path(self):
+        return self.output_path
+
+    def _next_chapter_name(self, part=1):
+        """다음 챕터의 (uid, file_name). part > 1이면 나뉜 뒷부분 파일"""
+        index = len(self.chapters) + 1
+        if part == 1:
+            return f"chapter_{index}", f"chap_{index:03d}.xhtml"
+        return f"chapter_{index}_{part}", f"chap_{index:03d}_{part}.xhtml"
+
+    def _set_cover_data(self, file_name, image_data):
+        self.cover = (file_name, image_data)
+        self.book.add_metadata(None, 'meta', '', {'name': 'cover', 'content': 'cover-img'})
+
+    @classmethod
+    def render_chapter(cls, title, content):
+        # XHTML로 바로 기록하므로 본문을 이스케이프
+        return (f"<h1>{html.escape(title, quote=False)}</h1>"
+                + cls.format_content(html.escape(content, quote=False)))
+
+    def _add_rendered_chapter(self, title, html_content):
+        parts = []
+        with stage(self.observer, "write"):
+            writer = self._open_writer()
+            for part, body in enumerate(self.split_rendered(html_content, self.max_part_bytes), 1):
+                uid, file_name = self._next_chapter_name(part)
+                writer.write_document(uid, file_name, title, body,
+                                      stylesheets=["style/main.css"])
+                parts.append((uid, file_name))
+        self.chapters.append((parts[0][1], title))
+        self.parts.append(parts)
+        self._report_written()
+
+    def _report_written(self):
+        # 챕터는 렌더링 직후 기록되므로 렌더링과 같은 기준으로 기록 진행률 보고
+        counters = self._render_counters
+        if counters is not None:
+            self.observer.progress("write", counters['chapters'], self._render_total)
+
+    def generate(self, output_path=None):
+        try:
+            with stage(self.observer, "write") as counters:
+                writer = self._open_writer()
+                if self.cover:
+                    # mimetypes는 urllib까지 불러오므로 표지가 있을 때만 import
+                    import mimetypes
+                    file_name, image_data = self.cover
+                    media_type = mimetypes.guess_type(file_name)[0] or "image/jpeg"
+                    writer.write_item("cover-img", file_name, image_data, media_type, "cover-image")
+
+                spine = ["nav"] + [uid for parts in self.parts for uid, _ in parts]
+                writer.finish(self.book.title, self.book.uid, self.book.metadata, self.chapters, spine)
+                self._finalize()
+                counters['bytes_out'] = os.path.getsize(self.output_path)
+        except BaseException:
+            # Ctrl+C 등으로 중단돼도 작성 중이던 파일을 남기지 않음
+            self.abort()
+            raise
+        print(f"Successfully generated: {self.output_path}")
+
+    def _finalize(self):
+        """EPUB 기록을 마친 뒤 처리 (하위 클래스용)"""
+        pass
+
+    def abort(self):
+        """작성 중인 EPUB 파일을 삭제"""
+        if self.writer is not None:
+            self.writer.abort()
+            self.writer = None
+
+
+class IncrementalEpubGenerator(StreamingEpubGenerator):
+    """
+    연재 중인 원고를 다시 빌드할 때 바뀐 챕터만 렌더링하는 생성기.
+    출력 파일 옆에 챕터 내용 해시 목록(<이름>.manifest.json)을 저장해 두고,
+    다음 빌드에서 해시가 같은 챕터는 이전 EPUB의 xhtml 항목을 압축된 그대로 복사한다.
+    OPF/NCX/nav와 표지, CSS는 매번 새로 만든다.
+    새 EPUB은 임시 파일에 쓰고 완료되면 기존 파일과 교체한다.
+    """
+
+    # render_chapter 결과가 달라지는 변경을 하면 올릴 것 (이전 빌드를 재사용하지 않게 됨)
+    RENDER_VERSION = 1
+    MANIFEST_FORMAT = 2
+
+    def __init__(self, title, output_path, author="Unknown", workers=1, observer=None):
+        super().__init__(title, output_path, author, workers, observer)
+        self.manifest_path = self.get_manifest_path(output_path)
+        self.chapter_hashes = []    # 이번 빌드의 챕터 순서대로
+        self.previous = None        # 이전 EPUB (zipfile.ZipFile)
+        self.previous_files = {}    # 챕터 해시 -> 이전 EPUB의 file_name 목록 (나뉜 파일 포함)
+        self.reused = 0
+
+    @staticmethod
+    def get_manifest_path(output_path):
+        return os.path.splitext(output_path)[0] + ".manifest.json"
+
+    @classmethod
+    def chapter_digest(cls, title, content, max_part_bytes=0):
+        # 파일 크기 제한이 바뀌면 나뉘는 위치도 달라지므로 해시에 포함
+        data = f"{cls.__name__}\0{cls.RENDER_VERSION}\0{max_part_bytes}\0{title}\0{content}"
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _writer_path(self):
+        return self.output_path + ".partial"
+
+    def _open_previous(self):
+        """이전 빌드의 manifest가 현재 EPUB과 맞으면 재사용할 챕터 목록을 불러옴"""
+        if self.previous is not None:
+            return
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if (manifest.get('format') != self.MANIFEST_FORMAT
+                    or manifest.get('epub_size') != os.path.getsize(self.output_path)):
+                return
+            self.previous = zipfile.ZipFile(self.output_path)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return
+        self.previous_files = {digest: file_names for file_names, digest in manifest['chapters']}
+
+    def _add_chapters(self, chapters):
+        self._open_previous()
+        if not self.previous_files:
+            # 첫 빌드: 해시만 기록하며 평소대로 (병렬 포함) 렌더링
+            return super()._add_chapters(self._record_hashes(chapters))
+
+        # 바뀐 챕터가 적은 경우가 대부분이라 직렬로 처리
+        added = 0
+        for title, content in self._record_hashes(chapters):
+            file_names = self.previous_files.get(self.chapter_hashes[-1])
+            if file_names is None or not self._copy_chapter(title, file_names):
+                self.add_chapter(title, content)
+            added += 1
+        return added
+
+    def _record_hashes(self, chapters):
+        for title, content in chapters:
+            self.chapter_hashes.append(self.chapter_digest(title, content, self.max_part_bytes))
+            yield title, content
+
+    def _copy_chapter(self, title, source_names):
+        """이전 EPUB의 챕터 항목(나뉜 파일 포함)을 복사. 항목이 없으면 False"""
+        # 일부만 복사하고 실패하면 되돌릴 수 없으므로 모든 파일이 있는지 먼저 확인
+        try:
+            for source_name in source_names:
+                self.previous.getinfo(f"{ROOT_DIR}/{source_name}")
+        except KeyError:
+            return False
+        parts = []
+        with stage(self.observer, "write"):
+            writer = self._open_writer()
+            for part, source_name in enumerate(source_names, 1):
+                uid, file_name = self._next_chapter_name(part)
+                writer.copy_item(self.previous, source_name, uid, file_name, "application/xhtml+xml")
+                parts.append((uid, file_name))
+        self.chapters.append((parts[0][1], title))
+        self.parts.append(parts)
+        self.reused += 1
+
+        counters = self._render_counters
+        if counters is not None:
+            counters['reused'] = counters.get('reused', 0) + 1
+            counters['chapters'] = counters.get('chapters', 0) + 1
+            self.observer.progress("render", counters['chapters'], self._render_total)
+        self._report_written()
+        return True
+
+    def _finalize(self):
+        self._close_previous()
+        os.replace(self._writer_path(), self.output_path)
+
+        if len(self.chapter_hashes) != len(self.chapters):
+            # add_chapters를 거치지 않고 추가된 챕터가 있으면 재사용 정보를 남기지 않음
+            if os.path.exists(self.manifest_path):
+                os.remove(self.manifest_path)
+            return
+        manifest = {
+            'format': self.MANIFEST_FORMAT,
+            'epub_size': os.path.getsize(self.output_path),
+            'chapters': [[[file_name for _, file_name in parts], digest]
+                         for parts, digest in zip(self.parts, self.chapter_hashes)],
+        }
+        temp_path = self.manifest_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, self.manifest_path)
+
+    def _close_previous(self):
+        if self.previous is not None:
+            self.previous.close()
+            self.previous = None
+
+    def abort(self):
+        """임시 파일만 삭제하고 이전 EPUB과 manifest는 그대로 둠"""
+        self._close_previous()
+        super().abort()
+
+
+def main():
     import argparse
     parser = argparse.ArgumentParser(description="Convert Text to EPUB for Web Novels")
-    parser.add_argument("--input", required=True, help="Path to input .txt file")
-    parser.add_argument("--output", required=True, help="Path to output .epub file")
+    parser.add_argument("--input", required=True, nargs="+", help="Path to input file(s)")
+    parser.add_argument("--output", help="Path to output .epub file")
+    parser.add_argument("--output-dir", help="Output folder for batch conversion")
     parser.add_argument("--title", default="My Web Novel", help="Title of the book")
     parser.add_argument("--author", default="Writer", help="Author name")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Write chapters to the EPUB as they are rendered (lower memory)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for chapter rendering (1 = serial, 0 = all cores)")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Files converted concurrently in batch mode (0 = all cores)")
+    parser.add_argument("--compression", choices=["store", "fast", "default", "max"],
+                        help="Zip compression level (requires --streaming or --incremental)")
+    parser.add_argument("--zip-threads", type=int, default=1,
+                        help="Threads compressing chapters in parallel (0 = all cores)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse unchanged chapters from the previous build of --output")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print time spent in each stage (extract, split, render, write)")
+    parser.add_argument("--max-part-kb", type=int, default=EpubGenerator.MAX_PART_BYTES // 1024,
+                        help="Split chapters larger than this into several XHTML files "
+                             "(KB, 0 = never split)")
+    parser.add_argument("--heading", action="append", metavar="FORMAT",
+                        help="Extra chapter heading format, {n} = number "
+                             "(e.g. '【{n}화】', 'Ch. {n}'); can be repeated")
     
     args = parser.parse_args()
-    
-    if os.path.exists(args.input):
-        gen = EpubGenerator(args.title, args.author)
+    if (args.compression or args.zip_threads != 1) and not (args.streaming or args.incremental):
+        # ebooklib로 기록하는 기본 경로는 압축 설정을 바꿀 수 없음
+        parser.error("--compression and --zip-threads require --streaming or --incremental")
+    try:
+        get_detector(args.heading)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.output_dir or len(args.input) > 1:
+        if not args.output_dir:
+            parser.error("--output-dir is required when converting several files")
+        sys.exit(run_batch_cli(args))
+    if not args.output:
+        parser.error("--output is required")
+
+    input_path = args.input[0]
+    if os.path.exists(input_path):
+        stats = ConversionStats() if args.stats else None
+        if args.incremental:
+            gen = IncrementalEpubGenerator(args.title, args.output, args.author, args.workers, stats)
+        elif args.streaming:
+            gen = StreamingEpubGenerator(args.title, args.output, args.author, args.workers, stats)
+        else:
+            gen = EpubGenerator(args.title, args.author, args.workers, stats)
+        if isinstance(gen, StreamingEpubGenerator):
+            gen.set_compression(args.compression or "default", args.zip_threads)
+        gen.set_heading_patterns(args.heading)
+        gen.set_part_size(args.max_part_kb * 1024)
+        # 북마크가 있는 PDF, DOCX는 문서 구조로 챕터를 나누고, 그 밖에는
+        # TXT는 파일에서, PDF는 페이지가 추출되는 대로 챕터 단위로 스트리밍 처리
         try:
-            raw_text = gen.extract_text(args.input)
+            if gen.process_document(input_path) is not None:
+                chapter_count = len(gen.chapters)
+            else:
+                with TextExtractor.open_stream(input_path, workers=gen.workers, observer=stats) as f:
+                    chapter_count = gen.process_stream(f)
+        except KeyboardInterrupt:
+            print("Cancelled")
+            if isinstance(gen, StreamingEpubGenerator):
+                gen.abort()
+            sys.exit(130)
         except Exception as e:
             print(f"Extraction failed: {str(e)}")
+            if isinstance(gen, StreamingEpubGenerator):
+                gen.abort()
             sys.exit(1)
-        
-        if not raw_text.strip():
-            print(f"Error: No text extracted from {args.input}")
+
+        if not chapter_count:
+            print(f"Error: No text extracted from {input_path}")
+            if isinstance(gen, StreamingEpubGenerator):
+                gen.abort()
             sys.exit(1)
-            
-        gen.process_text(raw_text)
-        gen.generate(args.output)
+
+        try:
+            gen.generate(args.output)
+        except KeyboardInterrupt:
+            # 작성 중이던 파일은 generate에서 이미 삭제됨
+            print("Cancelled")
+            sys.exit(130)
+        if args.incremental:
+            print(f"Reused {gen.reused} of {chapter_count} chapters from the previous build")
+        if stats:
+            print(stats.format_report())
     else:
-        print(f"Error: File not found {args.input}")
+        print(f"Error: File not found {input_path}")
+
+
+def run_batch_cli(args):
+    from batch_convert import build_jobs, run_batch
+    from conversion_stats import format_report
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = build_jobs(args.input, args.output_dir, args.author, streaming=args.streaming,
+                      stats=args.stats, incremental=args.incremental,
+                      compression=args.compression, heading_patterns=args.heading,
+                      part_size=args.max_part_kb * 1024)
+    failed = 0
+    for done, result in enumerate(run_batch(jobs, args.jobs), 1):
+        name = os.path.basename(result['input'])
+        if result['success']:
+            encoding = f", {result['encoding']}" if result['encoding'] else ""
+            if result['reused_chapters'] is not None:
+                encoding += f", {result['reused_chapters']} chapters reused"
+            counts = result['counts']
+            encoding += (f", {counts['words']:,} words, {counts['chars']:,} chars, "
+                         f"{counts['hangul']:,} Hangul")
+            print(f"[{done}/{len(jobs)}] OK   {name} -> {result['output']} "
+                  f"({result['output_size']:,} bytes, {result['duration']:.1f}s{encoding})")
+        else:
+            failed += 1
+            print(f"[{done}/{len(jobs)}] FAIL {name}: {result['error']} ({result['duration']:.1f}s)")
+        if result['stats']:
+            print(format_report(result['stats']))
+    print(f"Done: {len(jobs) - failed} succeeded, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    main()
@@ -2,31 +2,63 @@ import sys
 import os
 import json
 import threading
+import multiprocessing
 from datetime import datetime
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QLineEdit,
                              QFileDialog, QMessageBox, QProgressBar, QTabWidget,
                              QListWidget, QListWidgetItem, QDialog, QSpinBox,
-                             QComboBox, QGroupBox, QScrollArea, QFrame)
+                             QComboBox, QGroupBox, QScrollArea, QFrame, QCheckBox,
+                             QPlainTextEdit)
 from PyQt6.QtCore import Qt, pyqtSignal, QObject, QSettings
 from PyQt6.QtGui import QFont
 
+from app_config import ensure_config_dir
 from epub_gen import EpubGenerator
+from batch_convert import build_jobs, run_batch
+from cancellation import CancelToken, ConversionCancelled
+from chapter_headings import get_detector, parse_patterns
+from conversion_stats import ConversionStats, ProgressReporter, write_log
+from extract_cache import ExtractionCache
 from text_extractor import ExtractionError, MissingLibraryError
 
 VERSION = "2.1.0"
 
-# 설정 파일 경로
-def get_config_path():
-    if sys.platform == "darwin":
-        return os.path.expanduser("~/Library/Application Support/EPUB-Generator")
-    return os.path.expanduser("~/.epub-generator")
 
-def ensure_config_dir():
-    path = get_config_path()
-    os.makedirs(path, exist_ok=True)
-    return path
+def get_cache_size(settings):
+    """설정의 추출 캐시 용량 (바이트, 0이면 사용 안 함)"""
+    return settings.value("cache_size_mb", 512, int) * 1024 * 1024
+
+
+def get_stats_log_path(settings):
+    """단계별 측정 로그 파일 경로 (기록하지 않도록 설정했으면 None)"""
+    if not settings.value("stats_log", False, bool):
+        return None
+    return os.path.join(ensure_config_dir(), "conversion.log")
+
+
+def get_part_size(settings):
+    """설정의 챕터 파일 최대 크기 (바이트, 0이면 나누지 않음)"""
+    return settings.value("part_size_kb", EpubGenerator.MAX_PART_BYTES // 1024, int) * 1024
+
+
+def get_heading_patterns(settings):
+    """설정에 저장된 사용자 챕터 제목 형식 목록 (한 줄에 하나)"""
+    return parse_patterns(settings.value("heading_patterns", ""))
+
+
+# 단일 변환 진행률에서 각 단계가 차지하는 구간 (%)와 상태 문구
+STAGE_PROGRESS = {
+    'extract': (0, 40, "텍스트 추출 중"),
+    'split': (40, 45, "챕터 분할 중"),
+    'render': (45, 90, "챕터 변환 중"),
+    'write': (90, 100, "EPUB 저장 중"),
+}
+
+# 앞부분만 읽어 미리보기할 수 있는 형식 (TXT/PDF/HWPX는 스트리밍, DOCX는 문서 구조로 나눔).
+# 그 밖의 형식(HWP)은 전체를 추출해야 하므로 캐시를 거쳐 추출하고 파싱 결과를 변환에 재사용
+QUICK_PREVIEW_FORMATS = (".txt", ".pdf", ".hwpx", ".docx")
 
 
 class RecentFiles:
@@ -79,6 +111,8 @@ class WorkerSignals(QObject):
     progress = pyqtSignal(int, str)
     preview_ready = pyqtSignal(dict)
     batch_progress = pyqtSignal(int, int, str)  # current, total, filename
+    file_result = pyqtSignal(dict)  # 일괄 변환 파일별 결과
+    cancelled = pyqtSignal()
 
 
 class DropZone(QLabel):
@@ -163,7 +197,17 @@ class PreviewDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # 요약 정보
-        summary = QLabel(f"총 {preview_data['total_chapters']}개 챕터 | 약 {preview_data['total_words']:,}자")
+        # 빠른 미리보기는 앞부분만 읽으므로 전체 챕터 수나 분량을 모를 수 있음
+        total_chapters = preview_data['total_chapters']
+        if total_chapters is None:
+            text = f"{len(preview_data['chapters'])}개 이상 챕터"
+        else:
+            text = f"총 {total_chapters}개 챕터"
+        if preview_data['total_chars'] is not None:
+            text += (f" | {preview_data['total_chars']:,}자 "
+                     f"(공백 제외, 한글 {preview_data['total_hangul']:,}자) | "
+                     f"{preview_data['total_words']:,}단어")
+        summary = QLabel(text)
         summary.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px;")
         layout.addWidget(summary)
 
@@ -182,7 +226,7 @@ class PreviewDialog(QDialog):
             title.setStyleSheet("font-weight: bold; font-size: 14px;")
             frame_layout.addWidget(title)
 
-            info = QLabel(f"약 {chapter['word_count']:,}자")
+            info = QLabel(f"{chapter['char_count']:,}자 (공백 제외) | {chapter['word_count']:,}단어")
             info.setStyleSheet("color: #666; font-size: 12px;")
             frame_layout.addWidget(info)
 
@@ -193,8 +237,12 @@ class PreviewDialog(QDialog):
 
             content_layout.addWidget(frame)
 
-        if preview_data['total_chapters'] > len(preview_data['chapters']):
-            more = QLabel(f"... 외 {preview_data['total_chapters'] - len(preview_data['chapters'])}개 챕터")
+        more = None
+        if total_chapters is None:
+            more = QLabel("... 이후 챕터는 변환할 때 나눕니다")
+        elif total_chapters > len(preview_data['chapters']):
+            more = QLabel(f"... 외 {total_chapters - len(preview_data['chapters'])}개 챕터")
+        if more is not None:
             more.setStyleSheet("color: #666; font-style: italic; padding: 10px;")
             content_layout.addWidget(more)
 
@@ -256,6 +304,19 @@ class SettingsDialog(QDialog):
         scale_layout.addStretch()
         style_layout.addLayout(scale_layout)
 
+        # 챕터 파일 크기 (큰 챕터는 여러 파일로 나눠 리더에서 빨리 열리게)
+        part_layout = QHBoxLayout()
+        part_layout.addWidget(QLabel("챕터 파일 최대 크기:"))
+        self.part_size = QSpinBox()
+        self.part_size.setRange(0, 4096)
+        self.part_size.setSingleStep(64)
+        self.part_size.setSpecialValueText("나누지 않음")
+        self.part_size.setSuffix(" KB")
+        self.part_size.setValue(settings.value("part_size_kb", EpubGenerator.MAX_PART_BYTES // 1024, int))
+        part_layout.addWidget(self.part_size)
+        part_layout.addStretch()
+        style_layout.addLayout(part_layout)
+
         layout.addWidget(style_group)
 
         # 메타데이터 기본값
@@ -272,6 +333,59 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(meta_group)
 
+        # 챕터 제목 형식
+        heading_group = QGroupBox("추가 챕터 제목 형식")
+        heading_layout = QVBoxLayout(heading_group)
+        heading_hint = QLabel("한 줄에 하나씩, 숫자 자리는 {n}으로 입력 (예: 【{n}화】, Ch. {n})")
+        heading_hint.setStyleSheet("color: #666; font-size: 12px;")
+        heading_layout.addWidget(heading_hint)
+        self.heading_patterns = QPlainTextEdit(settings.value("heading_patterns", ""))
+        self.heading_patterns.setMaximumHeight(80)
+        heading_layout.addWidget(self.heading_patterns)
+
+        layout.addWidget(heading_group)
+
+        # 성능
+        perf_group = QGroupBox("성능")
+        perf_layout = QVBoxLayout(perf_group)
+
+        workers_layout = QHBoxLayout()
+        workers_layout.addWidget(QLabel("일괄 변환 동시 작업 수:"))
+        self.batch_workers = QSpinBox()
+        self.batch_workers.setRange(1, max(os.cpu_count() or 1, 1))
+        self.batch_workers.setValue(settings.value("batch_workers", os.cpu_count() or 1, int))
+        workers_layout.addWidget(self.batch_workers)
+        workers_layout.addStretch()
+        perf_layout.addLayout(workers_layout)
+
+        # 추출 캐시
+        cache_layout = QHBoxLayout()
+        cache_layout.addWidget(QLabel("추출 캐시 용량:"))
+        self.cache_size = QSpinBox()
+        self.cache_size.setRange(0, 10240)
+        self.cache_size.setSingleStep(128)
+        self.cache_size.setSpecialValueText("사용 안 함")
+        self.cache_size.setSuffix(" MB")
+        self.cache_size.setValue(settings.value("cache_size_mb", 512, int))
+        cache_layout.addWidget(self.cache_size)
+        cache_layout.addStretch()
+        clear_cache_btn = QPushButton("비우기")
+        clear_cache_btn.setObjectName("secondary")
+        clear_cache_btn.clicked.connect(self.clear_cache)
+        cache_layout.addWidget(clear_cache_btn)
+        perf_layout.addLayout(cache_layout)
+
+        self.cache_stats = QLabel()
+        self.cache_stats.setStyleSheet("color: #666; font-size: 12px;")
+        perf_layout.addWidget(self.cache_stats)
+        self.update_cache_stats()
+
+        self.stats_log = QCheckBox("변환 단계별 소요 시간을 conversion.log에 기록")
+        self.stats_log.setChecked(settings.value("stats_log", False, bool))
+        perf_layout.addWidget(self.stats_log)
+
+        layout.addWidget(perf_group)
+
         # 버튼
         btn_layout = QHBoxLayout()
         save_btn = QPushButton("저장")
@@ -284,13 +398,37 @@ class SettingsDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def save_settings(self):
+        patterns = parse_patterns(self.heading_patterns.toPlainText())
+        try:
+            get_detector(patterns)
+        except ValueError as e:
+            QMessageBox.warning(self, "챕터 제목 형식", str(e))
+            return
+
         self.settings.setValue("font_size", self.font_size.value())
         self.settings.setValue("line_height", self.line_height.currentText())
         self.settings.setValue("ui_scale", self.ui_scale.currentText())
+        self.settings.setValue("part_size_kb", self.part_size.value())
         self.settings.setValue("default_author", self.default_author.text())
         self.settings.setValue("default_publisher", self.default_publisher.text())
+        self.settings.setValue("batch_workers", self.batch_workers.value())
+        self.settings.setValue("cache_size_mb", self.cache_size.value())
+        self.settings.setValue("stats_log", self.stats_log.isChecked())
+        self.settings.setValue("heading_patterns", "\n".join(patterns))
         self.accept()
 
+    def update_cache_stats(self):
+        stats = ExtractionCache().stats()
+        self.cache_stats.setText(
+            f"{stats['entries']}개 항목, {stats['bytes'] / 1024 / 1024:.1f} MB 사용 | "
+            f"적중 {stats['total_hits']}회, 실패 {stats['total_misses']}회 "
+            f"(적중률 {stats['hit_rate']:.0%})"
+        )
+
+    def clear_cache(self):
+        ExtractionCache().clear()
+        self.update_cache_stats()
+
 
 class SingleConvertTab(QWidget):
     """단일 파일 변환 탭"""
@@ -300,6 +438,8 @@ class SingleConvertTab(QWidget):
         self.settings = settings
         self.cover_path = None
         self.current_preview = None
+        # 미리보기에서 파싱한 원고 (input_path, mtime_ns, Manuscript), 변환 때 재사용
+        self.current_manuscript = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -381,11 +521,17 @@ class SingleConvertTab(QWidget):
         self.run_btn = QPushButton("EPUB 생성")
         self.run_btn.clicked.connect(self.start_conversion)
         btn_layout.addWidget(self.run_btn)
+
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.setObjectName("secondary")
+        self.cancel_btn.clicked.connect(self.cancel_conversion)
+        self.cancel_btn.hide()
+        btn_layout.addWidget(self.cancel_btn)
         layout.addLayout(btn_layout)
 
         # 진행률
         self.progress = QProgressBar()
-        self.progress.setRange(0, 0)
+        self.progress.setRange(0, 100)
         self.progress.hide()
         layout.addWidget(self.progress)
 
@@ -400,9 +546,14 @@ class SingleConvertTab(QWidget):
         # 시그널
         self.signals = WorkerSignals()
         self.signals.finished.connect(self.on_finished)
+        self.signals.progress.connect(self.on_progress)
+        self.signals.cancelled.connect(self.on_cancelled)
         self.signals.preview_ready.connect(self.on_preview_ready)
+        self.cancel_token = None
+        self.last_progress = None
 
     def set_file(self, file_path):
+        self.current_manuscript = None
         self.file_input.setText(file_path)
         base = os.path.basename(file_path)
         self.title_input.setText(os.path.splitext(base)[0])
@@ -439,12 +590,43 @@ class SingleConvertTab(QWidget):
         self.status.setText("미리보기 생성 중...")
         threading.Thread(target=self._generate_preview, args=(input_path,), daemon=True).start()
 
+    def _extract(self, gen, input_path):
+        # 같은 파일을 다시 변환하거나 미리보기할 때 다시 추출하지 않도록 캐시 사용
+        cache_size = get_cache_size(self.settings)
+        if cache_size:
+            return ExtractionCache(max_bytes=cache_size).extract(input_path, observer=gen.observer)
+        return gen.extract_text(input_path)
+
+    def _take_manuscript(self, gen, input_path):
+        """미리보기 때 파싱한 원고가 같은 파일, 같은 제목 형식이면 넘겨주고 보관본은 해제"""
+        cached, self.current_manuscript = self.current_manuscript, None
+        if cached is None:
+            return None
+        path, mtime_ns, headings, manuscript = cached
+        if path != input_path or os.stat(input_path).st_mtime_ns != mtime_ns:
+            return None
+        if headings is not gen.headings:
+            return None
+        return manuscript
+
     def _generate_preview(self, input_path):
         try:
             gen = EpubGenerator("Preview", "")
-            content = gen.extract_text(input_path)
-            if content and content.strip():
-                preview = gen.get_chapter_preview(content)
+            gen.set_heading_patterns(get_heading_patterns(self.settings))
+            ext = os.path.splitext(input_path)[1].lower()
+            if ext in QUICK_PREVIEW_FORMATS:
+                # 앞부분만 읽어 바로 보여 줌 (파일 해시나 전체 추출 없이, 전체 추출은 변환할 때)
+                preview = gen.get_quick_preview(input_path)
+            else:
+                content = self._extract(gen, input_path)
+                if content and content.strip():
+                    manuscript = gen.parse_manuscript(content)
+                    self.current_manuscript = (input_path, os.stat(input_path).st_mtime_ns,
+                                               gen.headings, manuscript)
+                    preview = gen.get_chapter_preview(manuscript)
+                else:
+                    preview = None
+            if preview and preview['chapters']:
                 self.signals.preview_ready.emit(preview)
             else:
                 self.signals.preview_ready.emit({'error': '텍스트를 추출할 수 없습니다.'})
@@ -475,8 +657,13 @@ class SingleConvertTab(QWidget):
             return
 
         self.run_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.show()
+        self.progress.setValue(0)
         self.progress.show()
         self.status.setText("변환 중...")
+        self.cancel_token = CancelToken()
+        self.last_progress = None
 
         # 메타데이터 수집
         metadata = {
@@ -494,43 +681,76 @@ class SingleConvertTab(QWidget):
 
     def run_logic(self, input_path, output_path, title, author, metadata):
         try:
-            gen = EpubGenerator(title, author)
-
-            # 추가 메타데이터 설정
-            if metadata.get('publisher'):
-                gen.book.add_metadata('DC', 'publisher', metadata['publisher'])
-            if metadata.get('series'):
-                gen.book.add_metadata(None, 'meta', metadata['series'],
-                                      {'name': 'calibre:series'})
-                if metadata.get('series_num'):
-                    gen.book.add_metadata(None, 'meta', str(metadata['series_num']),
-                                          {'name': 'calibre:series_index'})
-
-            # 표지 설정
-            if metadata.get('cover'):
-                gen.set_cover(metadata['cover'])
+            log_path = get_stats_log_path(self.settings)
+            stats = ConversionStats() if log_path else None
+            observer = ProgressReporter(self._report_progress, self.cancel_token, stats)
+            gen = EpubGenerator(title, author, observer=observer)
+
+            # 추가 메타데이터 및 표지 설정
+            gen.apply_metadata(metadata)
 
             # 스타일 적용
             font_size = self.settings.value("font_size", 16, int)
             line_height = self.settings.value("line_height", "1.8")
-            gen.style = gen.style.replace("line-height: 1.8", f"line-height: {line_height}")
-
-            content = gen.extract_text(input_path)
-            if not content or not content.strip():
-                raise ExtractionError("텍스트를 추출하지 못했습니다.")
-
-            gen.process_text(content)
+            gen.set_line_height(line_height)
+            gen.set_heading_patterns(get_heading_patterns(self.settings))
+            gen.set_part_size(get_part_size(self.settings))
+
+            manuscript = self._take_manuscript(gen, input_path)
+            # 북마크가 있는 PDF, DOCX는 문서 구조로 챕터를 나눔
+            if manuscript is not None or gen.process_document(input_path) is None:
+                if manuscript is None:
+                    content = self._extract(gen, input_path)
+                    if not content or not content.strip():
+                        raise ExtractionError("텍스트를 추출하지 못했습니다.")
+                    manuscript = gen.parse_manuscript(content)
+                gen.process_text(manuscript)
             gen.generate(output_path)
+            if stats:
+                stats.write_log(log_path, input_path)
 
             # 최근 파일에 추가
             self.recent_files.add(input_path, title, author)
 
             self.signals.finished.emit(True, output_path)
+        except ConversionCancelled:
+            self.signals.cancelled.emit()
         except Exception as e:
             self.signals.finished.emit(False, str(e))
 
+    def _report_progress(self, stage, done, total):
+        """변환 스레드에서 호출됨. 표시가 바뀔 때만 시그널을 보냄"""
+        if stage not in STAGE_PROGRESS:
+            return
+        start, end, label = STAGE_PROGRESS[stage]
+        percent = start
+        if total:
+            percent += (end - start) * min(done, total) // total
+            if stage == 'render':
+                label += f" ({done:,}/{total:,})"
+        if (percent, stage) != self.last_progress:
+            self.last_progress = (percent, stage)
+            self.signals.progress.emit(percent, label)
+
+    def on_progress(self, percent, label):
+        self.progress.setValue(percent)
+        self.status.setText(label + "...")
+
+    def cancel_conversion(self):
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status.setText("취소하는 중...")
+
+    def on_cancelled(self):
+        self.run_btn.setEnabled(True)
+        self.cancel_btn.hide()
+        self.progress.hide()
+        self.status.setText("변환이 취소되었습니다.")
+
     def on_finished(self, success, result):
         self.run_btn.setEnabled(True)
+        self.cancel_btn.hide()
         self.progress.hide()
         if success:
             self.status.setText("변환 완료!")
@@ -607,10 +827,18 @@ class BatchConvertTab(QWidget):
         self.run_btn.clicked.connect(self.start_batch)
         layout.addWidget(self.run_btn)
 
+        self.cancel_btn = QPushButton("취소")
+        self.cancel_btn.setObjectName("secondary")
+        self.cancel_btn.clicked.connect(self.cancel_batch)
+        self.cancel_btn.hide()
+        layout.addWidget(self.cancel_btn)
+
         # 시그널
         self.signals = WorkerSignals()
         self.signals.batch_progress.connect(self.on_batch_progress)
+        self.signals.file_result.connect(self.on_file_result)
         self.signals.finished.connect(self.on_batch_finished)
+        self.cancel_token = None
 
     def add_files(self, files):
         for f in files:
@@ -658,8 +886,15 @@ class BatchConvertTab(QWidget):
             return
 
         self.run_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.show()
         self.progress.show()
         self.progress.setValue(0)
+        # 워커 프로세스에서도 확인할 수 있는 토큰
+        self.cancel_token = CancelToken(shared=True)
+        for i, file_path in enumerate(self.file_list):
+            self.list_widget.item(i).setText(os.path.basename(file_path))
+            self.list_widget.item(i).setToolTip("")
 
         threading.Thread(
             target=self.run_batch,
@@ -668,41 +903,78 @@ class BatchConvertTab(QWidget):
         ).start()
 
     def run_batch(self, files, output_folder):
-        success_count = 0
-        fail_count = 0
-
-        for i, file_path in enumerate(files):
-            filename = os.path.basename(file_path)
-            self.signals.batch_progress.emit(i + 1, len(files), filename)
-
-            try:
-                title = os.path.splitext(filename)[0]
-                author = self.settings.value("default_author", "작가 미상")
-                output_path = os.path.join(output_folder, f"{title}.epub")
-
-                gen = EpubGenerator(title, author)
-                content = gen.extract_text(file_path)
-
-                if content and content.strip():
-                    gen.process_text(content)
-                    gen.generate(output_path)
-                    self.recent_files.add(file_path, title, author)
-                    success_count += 1
-                else:
-                    fail_count += 1
-            except Exception:
-                fail_count += 1
-
-        self.signals.finished.emit(True, f"완료: {success_count}개 성공, {fail_count}개 실패")
+        author = self.settings.value("default_author", "작가 미상")
+        line_height = self.settings.value("line_height", "1.8")
+        workers = self.settings.value("batch_workers", os.cpu_count() or 1, int)
+        log_path = get_stats_log_path(self.settings)
+        jobs = build_jobs(files, output_folder, author, line_height=line_height,
+                          cache_size=get_cache_size(self.settings), stats=bool(log_path),
+                          heading_patterns=get_heading_patterns(self.settings),
+                          part_size=get_part_size(self.settings))
+
+        failed = []
+        cancelled = 0
+        for done, result in enumerate(run_batch(jobs, workers, self.cancel_token), 1):
+            self.signals.file_result.emit(result)
+            self.signals.batch_progress.emit(done, len(jobs), os.path.basename(result['input']))
+            if result['stats']:
+                write_log(log_path, result['input'], result['stats'])
+            if result['success']:
+                title = os.path.splitext(os.path.basename(result['input']))[0]
+                self.recent_files.add(result['input'], title, author)
+            elif result['cancelled']:
+                cancelled += 1
+            else:
+                failed.append(f"{os.path.basename(result['input'])}: {result['error']}")
+
+        succeeded = len(jobs) - len(failed) - cancelled
+        message = f"완료: {succeeded}개 성공, {len(failed)}개 실패"
+        if cancelled:
+            message += f", {cancelled}개 취소"
+        if failed:
+            message += "\n\n" + "\n".join(failed[:10])
+            if len(failed) > 10:
+                message += f"\n... 외 {len(failed) - 10}개"
+        self.signals.finished.emit(True, message)
 
     def on_batch_progress(self, current, total, filename):
         self.progress.setValue(int(current / total * 100))
         self.status.setText(f"변환 중... ({current}/{total}) {filename}")
 
+    def on_file_result(self, result):
+        if result['input'] not in self.file_list:
+            return
+        item = self.list_widget.item(self.file_list.index(result['input']))
+        name = os.path.basename(result['input'])
+        if result['success']:
+            size_kb = result['output_size'] / 1024
+            item.setText(f"✅ {name} ({size_kb:,.0f}KB, {result['duration']:.1f}초)")
+            tooltip = result['output']
+            if result['encoding']:
+                tooltip += f"\n인코딩: {result['encoding']} (신뢰도 {result['encoding_confidence']:.0%})"
+            if result['counts']:
+                counts = result['counts']
+                tooltip += (f"\n{counts['chars']:,}자 (공백 제외, 한글 {counts['hangul']:,}자), "
+                            f"{counts['words']:,}단어")
+            item.setToolTip(tooltip)
+        elif result['cancelled']:
+            item.setText(f"⏹ {name}")
+            item.setToolTip(result['error'])
+        else:
+            item.setText(f"❌ {name}")
+            item.setToolTip(result['error'])
+
+    def cancel_batch(self):
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status.setText("취소하는 중...")
+
     def on_batch_finished(self, success, message):
         self.run_btn.setEnabled(True)
+        self.cancel_btn.hide()
         self.progress.hide()
-        self.status.setText(message)
+        self.status.setText(message.split("\n")[0])
         QMessageBox.information(self, "일괄 변환 완료", message)
 
 
@@ -933,6 +1205,8 @@ def apply_scale_before_app():
 
 
 if __name__ == "__main__":
+    # 일괄 변환 프로세스 풀이 패키징된 앱에서도 동작하도록
+    multiprocessing.freeze_support()
     apply_scale_before_app()
     app = QApplication(sys.argv)
     window = EpubGuiQt()
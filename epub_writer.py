@@ -0,0 +1,295 @@
+import os
+import sys
+import html
+import time
+import zlib
+import struct
+import zipfile
+from collections import deque
+from datetime import datetime, timezone
+
+# ebooklib과 같은 내부 구조 (EPUB/ 폴더, id="id" 식별자)
+ROOT_DIR = "EPUB"
+IDENTIFIER_ID = "id"
+
+NAMESPACE_DC = "http://purl.org/dc/elements/1.1/"
+NAMESPACE_OPF = "http://www.idpf.org/2007/opf"
+
+CONTAINER_XML = f"""<?xml version="1.0" encoding="utf-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="{ROOT_DIR}/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+# 압축 수준 (None이면 압축하지 않고 저장)
+COMPRESSION_LEVELS = {
+    "store": None,
+    "fast": 1,
+    "default": 6,
+    "max": 9,
+}
+
+XHTML_HEADER = (
+    '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE html>\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" '
+    'lang="{lang}" xml:lang="{lang}">'
+)
+
+
+# 압축된 데이터를 그대로 기록하려면 zipfile 내부 구조(fp, start_dir, filelist, NameToInfo,
+# structFileHeader)를 직접 다뤄야 한다. 구조를 확인한 버전에서만 쓰고,
+# 그 밖에는 공개 API(writestr)로 다시 압축해 기록한다.
+RAW_MEMBERS = ((3, 8) <= sys.version_info[:2] <= (3, 13)
+               and hasattr(zipfile, "structFileHeader")
+               and hasattr(zipfile, "sizeFileHeader")
+               and hasattr(zipfile.ZipInfo, "FileHeader"))
+
+
+# xml.sax.saxutils는 urllib까지 불러오므로 html.escape로 대신함
+def escape(text):
+    return html.escape(text, quote=False)
+
+
+def quoteattr(value):
+    return f'"{html.escape(value)}"'
+
+
+def render_xhtml(title, body, language="ko", stylesheets=()):
+    """본문 HTML 조각을 완전한 XHTML 문서로 감싼다"""
+    links = "".join(
+        f'<link href={quoteattr(href)} rel="stylesheet" type="text/css"/>' for href in stylesheets
+    )
+    return (
+        XHTML_HEADER.format(lang=language)
+        + f"<head><title>{escape(title)}</title>{links}</head>"
+        + f"<body>{body}</body></html>"
+    )
+
+
+class EpubStreamWriter:
+    """
+    EPUB(zip)을 순차적으로 기록.
+    mimetype과 container.xml을 먼저 쓰고, 리소스/챕터는 받는 즉시 압축해 기록하며,
+    OPF/NCX/nav는 finish()에서 모아 둔 작은 메타데이터로 마지막에 생성한다.
+    compression: COMPRESSION_LEVELS의 키 (store, fast, default, max)
+    threads: 1보다 크면 항목 압축을 스레드 풀에서 동시에 처리 (zlib은 압축 중 GIL을 놓음).
+             기록 순서는 write_item 호출 순서 그대로 유지된다.
+    """
+
+    def __init__(self, path, language="ko", compression="default", threads=1):
+        if compression not in COMPRESSION_LEVELS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.path = path
+        self.language = language
+        self.manifest = []  # (uid, file_name, media_type, properties)
+        self.level = COMPRESSION_LEVELS[compression]
+        if self.level is None:
+            self.zip = zipfile.ZipFile(path, "w", zipfile.ZIP_STORED)
+        else:
+            self.zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=self.level)
+        # 압축 결과를 그대로 기록할 수 없으면 스레드 풀로 미리 압축해도 소용없음
+        self.threads = threads if self.level is not None and RAW_MEMBERS else 1
+        self.pool = None
+        if self.threads > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            self.pool = ThreadPoolExecutor(max_workers=threads)
+        self.pending = deque()  # (name, future) 압축이 끝나는 대로 순서대로 기록
+        # mimetype은 반드시 첫 항목이며 압축하지 않음
+        self.zip.writestr(zipfile.ZipInfo("mimetype"), "application/epub+zip",
+                          compress_type=zipfile.ZIP_STORED)
+        self.zip.writestr("META-INF/container.xml", CONTAINER_XML)
+
+    def write_item(self, uid, file_name, data, media_type, properties=None):
+        name = f"{ROOT_DIR}/{file_name}"
+        if self.pool is None:
+            self.zip.writestr(name, data)
+        else:
+            self.pending.append((name, self.pool.submit(_deflate, data, self.level)))
+            # 압축된 결과가 쌓이지 않도록 대기 수를 제한
+            if len(self.pending) >= self.threads * 2:
+                self._write_pending(1)
+        self.manifest.append((uid, file_name, media_type, properties))
+
+    def _write_pending(self, count=None):
+        while self.pending and (count is None or count > 0):
+            name, future = self.pending.popleft()
+            data, crc, size = future.result()
+            _write_raw_member(self.zip, name, data, crc, size, zipfile.ZIP_DEFLATED)
+            if count is not None:
+                count -= 1
+
+    def write_document(self, uid, file_name, title, body, stylesheets=()):
+        content = render_xhtml(title, body, self.language, stylesheets)
+        self.write_item(uid, file_name, content.encode("utf-8"), "application/xhtml+xml")
+
+    def copy_item(self, source, source_name, uid, file_name, media_type, properties=None):
+        """
+        다른 EPUB(읽기 모드 zipfile.ZipFile)의 항목을 압축을 풀지 않고 그대로 복사.
+        source_name, file_name은 EPUB/ 폴더 기준 경로 (이름은 달라도 됨)
+        """
+        self._write_pending()
+        _copy_raw_member(source, f"{ROOT_DIR}/{source_name}", self.zip, f"{ROOT_DIR}/{file_name}")
+        self.manifest.append((uid, file_name, media_type, properties))
+
+    def finish(self, book_title, identifier, metadata, toc, spine):
+        """
+        nav, NCX, OPF를 기록하고 파일을 닫는다.
+        toc: [(file_name, title)], spine: [uid] ("nav" 포함 가능)
+        """
+        self._write_pending()
+        self._shutdown_pool()
+        self._write_nav(book_title, toc)
+        self._write_ncx(book_title, identifier, toc)
+        self._write_opf(metadata, spine)
+        self.zip.close()
+
+    def abort(self):
+        """기록 중인 파일을 닫고 삭제"""
+        try:
+            self._shutdown_pool(cancel=True)
+            self.zip.close()
+        finally:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _shutdown_pool(self, cancel=False):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=cancel)
+            self.pool = None
+            self.pending.clear()
+
+    def _write_nav(self, book_title, toc):
+        with self.zip.open(f"{ROOT_DIR}/nav.xhtml", "w") as f:
+            f.write(XHTML_HEADER.format(lang=self.language).encode("utf-8"))
+            f.write(f"<head><title>{escape(book_title)}</title></head><body>"
+                    f'<nav epub:type="toc" id="id" role="doc-toc"><h2>{escape(book_title)}</h2><ol>'
+                    .encode("utf-8"))
+            for file_name, title in toc:
+                f.write(f'<li><a href={quoteattr(file_name)}>{escape(title)}</a></li>'.encode("utf-8"))
+            f.write(b"</ol></nav></body></html>")
+        self.manifest.append(("nav", "nav.xhtml", "application/xhtml+xml", "nav"))
+
+    def _write_ncx(self, book_title, identifier, toc):
+        with self.zip.open(f"{ROOT_DIR}/toc.ncx", "w") as f:
+            f.write(
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">'
+                f'<head><meta name="dtb:uid" content={quoteattr(identifier)}/>'
+                '<meta name="dtb:depth" content="1"/>'
+                '<meta name="dtb:totalPageCount" content="0"/>'
+                '<meta name="dtb:maxPageNumber" content="0"/></head>'
+                f"<docTitle><text>{escape(book_title)}</text></docTitle><navMap>"
+                .encode("utf-8"))
+            for order, (file_name, title) in enumerate(toc, 1):
+                f.write(
+                    f'<navPoint id="navPoint-{order}" playOrder="{order}">'
+                    f"<navLabel><text>{escape(title)}</text></navLabel>"
+                    f"<content src={quoteattr(file_name)}/></navPoint>"
+                    .encode("utf-8"))
+            f.write(b"</navMap></ncx>")
+        self.manifest.append(("ncx", "toc.ncx", "application/x-dtbncx+xml", None))
+
+    def _write_opf(self, metadata, spine):
+        modified = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self.zip.open(f"{ROOT_DIR}/content.opf", "w") as f:
+            f.write(
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                f'<package xmlns="{NAMESPACE_OPF}" version="3.0" unique-identifier="{IDENTIFIER_ID}">'
+                f'<metadata xmlns:dc="{NAMESPACE_DC}" xmlns:opf="{NAMESPACE_OPF}">'
+                .encode("utf-8"))
+            for element in _metadata_elements(metadata):
+                f.write(element.encode("utf-8"))
+            f.write(f'<meta property="dcterms:modified">{modified}</meta></metadata><manifest>'
+                    .encode("utf-8"))
+            for uid, file_name, media_type, properties in self.manifest:
+                props = f" properties={quoteattr(properties)}" if properties else ""
+                f.write(f'<item href={quoteattr(file_name)} id={quoteattr(uid)} '
+                        f'media-type="{media_type}"{props}/>'.encode("utf-8"))
+            f.write(b'</manifest><spine toc="ncx">')
+            for uid in spine:
+                f.write(f"<itemref idref={quoteattr(uid)}/>".encode("utf-8"))
+            f.write(b"</spine></package>")
+
+
+def _deflate(data, level):
+    """zip 항목용 raw deflate 압축 (워커 스레드에서 실행). (압축 데이터, CRC, 원본 크기)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data), len(data)
+
+
+def _copy_raw_member(source, source_name, target, name):
+    # zipfile에는 압축된 데이터를 그대로 옮기는 API가 없어서,
+    # 로컬 헤더 뒤의 압축 데이터를 읽고 새 헤더와 함께 target에 직접 기록한다.
+    src = source.getinfo(source_name)
+    if not _raw_writable(target, src.compress_size, src.file_size):
+        info = _member_info(name, src.date_time, src.compress_type, src.external_attr)
+        target.writestr(info, source.read(src))
+        return
+    source.fp.seek(src.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, source.fp.read(zipfile.sizeFileHeader))
+    # 10, 11: 파일 이름 길이, extra 필드 길이
+    source.fp.seek(header[10] + header[11], os.SEEK_CUR)
+    data = source.fp.read(src.compress_size)
+    _write_raw_member(target, name, data, src.CRC, src.file_size, src.compress_type,
+                      src.date_time, src.external_attr)
+
+
+def _write_raw_member(target, name, data, crc, file_size, compress_type,
+                      date_time=None, external_attr=0o600 << 16):
+    """이미 압축된 데이터를 zip 항목으로 기록"""
+    info = _member_info(name, date_time, compress_type, external_attr)
+    if not _raw_writable(target, len(data), file_size):
+        # 내부 구조를 쓸 수 없으면 풀어서 공개 API로 다시 압축
+        if compress_type == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS)
+        target.writestr(info, data)
+        return
+    info.CRC = crc
+    info.compress_size = len(data)
+    info.file_size = file_size
+
+    # ZipFile.writestr와 같이 중앙 디렉터리 시작 위치에 이어 쓰고 목록에 등록
+    target.fp.seek(target.start_dir)
+    info.header_offset = target.fp.tell()
+    target.fp.write(info.FileHeader(False))
+    target.fp.write(data)
+    target.start_dir = target.fp.tell()
+    target.filelist.append(info)
+    target.NameToInfo[name] = info
+
+
+def _member_info(name, date_time, compress_type, external_attr):
+    info = zipfile.ZipInfo(name, date_time or time.localtime(time.time())[:6])
+    info.compress_type = compress_type
+    info.external_attr = external_attr
+    return info
+
+
+def _raw_writable(target, compress_size, file_size):
+    """target에 헤더를 직접 써도 되는지 (ZIP64 헤더가 필요한 큰 항목은 제외)"""
+    return (RAW_MEMBERS
+            and all(hasattr(target, attr) for attr in ("fp", "start_dir", "filelist", "NameToInfo"))
+            and max(compress_size, file_size) < zipfile.ZIP64_LIMIT)
+
+
+def _metadata_elements(metadata):
+    """ebooklib EpubBook.metadata 구조를 OPF 메타데이터 요소로 변환"""
+    for namespace, names in metadata.items():
+        for name, values in names.items():
+            for value, others in values:
+                others = others or {}
+                if others.get("property") == "dcterms:modified":
+                    continue
+                if namespace == NAMESPACE_DC:
+                    tag = f"dc:{name}"
+                elif namespace == NAMESPACE_OPF:
+                    tag = "meta"
+                else:
+                    tag = name
+                attrs = "".join(f" {key}={quoteattr(str(val))}" for key, val in others.items())
+                if value:
+                    yield f"<{tag}{attrs}>{escape(str(value))}</{tag}>"
+                else:
+                    yield f"<{tag}{attrs}/>"
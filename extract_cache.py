@@ -0,0 +1,273 @@
+import os
+import json
+import gzip
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+import contextlib
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+from app_config import get_config_path
+from conversion_stats import stage
+from text_extractor import TextExtractor, EXTRACTOR_VERSION
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class ExtractionCache:
+    """
+    추출한 텍스트를 파일 내용 해시로 저장하는 디스크 캐시.
+    키는 (내용 SHA-256, 확장자, EXTRACTOR_VERSION)이며, 같은 경로의 크기/수정 시각이
+    그대로면 해시를 다시 계산하지 않는다. 항목은 gzip으로 저장하고,
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제한다.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or os.path.join(get_config_path(), "extract_cache")
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.lock_path = os.path.join(self.cache_dir, "index.lock")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def extract(self, file_path, info=None, workers=1, observer=None):
+        """캐시에 있으면 바로 반환하고, 없으면 TextExtractor로 추출해 저장"""
+        with stage(observer, "extract") as counters:
+            text = self.get(file_path, info)
+            if text is not None:
+                counters['cache_hits'] = 1
+                counters['bytes_in'] = os.path.getsize(file_path)
+                counters['chars_out'] = len(text)
+                return text
+
+        # 추출 단계(진행률/취소 포함)는 TextExtractor가 직접 보고
+        details = {}
+        text = TextExtractor.extract(file_path, details, workers, observer)
+        with stage(observer, "extract"):
+            self.put(file_path, text, details)
+        if info is not None:
+            info.update(details)
+        return text
+
+    def get(self, file_path, info=None):
+        key, record = self._key(file_path)
+        with self._locked():
+            index = self._load_index()
+            index['files'][record[0]] = record[1]
+            entry = index['entries'].get(key)
+            path = self._entry_path(key)
+            if entry is None or not os.path.exists(path):
+                self._record(index, hit=False)
+                self._save_index(index)
+                return None
+
+            entry['last_used'] = time.time()
+            self._record(index, hit=True)
+            self._save_index(index)
+
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            text = f.read()
+        if info is not None:
+            info.update(entry.get('info', {}))
+        return text
+
+    def put(self, file_path, text, info=None):
+        if self.max_bytes <= 0:
+            return
+        key, record = self._key(file_path)
+        # 압축 기록은 오래 걸리므로 잠금 밖에서 임시 파일에 쓰고, 색인과 함께 교체
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, \
+                    gzip.open(raw, "wt", encoding="utf-8", newline="", compresslevel=1) as f:
+                f.write(text)
+            with self._locked():
+                index = self._load_index()
+                os.replace(tmp_path, self._entry_path(key))
+                index['files'][record[0]] = record[1]
+                index['entries'][key] = {
+                    'size': os.path.getsize(self._entry_path(key)),
+                    'last_used': time.time(),
+                    'info': info or {},
+                }
+                self._evict(index)
+                self._save_index(index)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def stats(self):
+        """캐시 크기 조정용 통계 (적중/실패는 이 인스턴스와 누적 값 모두 제공)"""
+        with self._locked():
+            index = self._load_index()
+        total_hits = index['stats']['hits']
+        total_misses = index['stats']['misses']
+        lookups = total_hits + total_misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'total_hits': total_hits,
+            'total_misses': total_misses,
+            'hit_rate': total_hits / lookups if lookups else 0.0,
+            'entries': len(index['entries']),
+            'bytes': sum(e['size'] for e in index['entries'].values()),
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self):
+        with self._locked():
+            index = self._load_index()
+            for key in list(index['entries']):
+                self._remove_entry(index, key)
+            # 색인에 없는 항목 파일(이전 버전에서 남은 것 등)도 삭제
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".txt.gz"):
+                    os.remove(os.path.join(self.cache_dir, name))
+            index['files'] = {}
+            index['stats'] = {'hits': 0, 'misses': 0}
+            self._save_index(index)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """
+        색인을 읽고 고쳐 쓰는 동안 잡는 잠금. 이 프로세스의 다른 스레드와
+        같은 캐시를 쓰는 다른 프로세스(일괄 변환 워커)를 함께 막는다.
+        """
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.lock_path, "a+b") as f:
+                _lock_file(f)
+                try:
+                    yield
+                finally:
+                    _unlock_file(f)
+
+    def _key(self, file_path):
+        """(캐시 키, (절대 경로, 파일 해시 기록)). 기록은 색인을 저장할 때 함께 남긴다"""
+        # 크기와 수정 시각이 같으면 이전에 계산한 해시를 재사용
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self._locked():
+            known = self._load_index()['files'].get(file_path)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            digest = known['digest']
+        else:
+            # 큰 파일은 오래 걸리므로 잠금 밖에서 계산
+            digest = _file_digest(file_path)
+        record = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'digest': digest,
+        }
+        ext = os.path.splitext(file_path)[1].lower().lstrip(".")
+        return f"{digest}-{ext}-v{EXTRACTOR_VERSION}", (file_path, record)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.txt.gz")
+
+    def _record(self, index, hit):
+        if hit:
+            self.hits += 1
+            index['stats']['hits'] += 1
+        else:
+            self.misses += 1
+            index['stats']['misses'] += 1
+
+    def _evict(self, index):
+        entries = index['entries']
+        total = sum(e['size'] for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]['size']
+            self._remove_entry(index, key)
+        # 캐시 항목이 없는 파일 해시 기록은 정리
+        live = {key.split("-")[0] for key in entries}
+        index['files'] = {path: record for path, record in index['files'].items()
+                          if record['digest'] in live}
+
+    def _remove_entry(self, index, key):
+        index['entries'].pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+
+    def _load_index(self):
+        index = None
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except Exception:
+            pass
+        if not isinstance(index, dict):
+            index = {}
+        index.setdefault('files', {})
+        index.setdefault('entries', {})
+        index.setdefault('stats', {'hits': 0, 'misses': 0})
+        return index
+
+    def _save_index(self, index):
+        # _locked() 안에서 호출. 저장 도중 중단되어도 색인이 깨지지 않도록 임시 파일로 교체
+        # 색인을 못 써도 변환은 계속하되, 오류는 기록하고 임시 파일은 남기지 않는다
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+            tmp_path = None
+        except OSError as e:
+            logger.warning("추출 캐시 색인 저장 실패 (%s): %s", self.index_path, e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        # 첫 바이트를 잠금 (LK_LOCK은 잠시 재시도한 뒤 OSError)
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _file_digest(file_path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,142 @@
+from array import array
+
+from text_counts import count_text, has_words
+
+
+class Manuscript:
+    """
+    챕터 경계를 원고 텍스트의 오프셋으로 기록한 구조.
+    한 번 파싱해 두면 미리보기와 변환이 같은 결과를 함께 사용한다.
+
+    챕터마다 (제목 시작, 제목 끝, 본문 시작, 본문 끝)을 array에 정수로만 저장하고
+    제목과 본문 문자열은 꺼낼 때 text에서 잘라 낸다 (챕터 1만 개도 색인은 수백 KB).
+    단어/글자/한글 수는 변환에 필요 없으므로 처음 요청할 때 센다.
+    text[start:end]는 process_text가 add_chapter에 넘기던 본문과 같다
+    (서문과 챕터가 없는 원고는 원문 그대로, 제목이 있는 챕터는 strip된 범위).
+    """
+
+    __slots__ = ("text", "has_intro", "_totals", "_counts",
+                 "_title_start", "_title_end", "_start", "_end")
+
+    def __init__(self, text, has_intro=False):
+        self.text = text
+        self.has_intro = has_intro
+        self._totals = None   # 원고 전체의 counts() (처음 요청할 때 셈)
+        self._counts = {}     # 챕터 번호 → counts(index)
+        # 제목 범위가 -1이면 원문에 없는 제목 ("Introduction", "Chapter 1")
+        self._title_start = array("q")
+        self._title_end = array("q")
+        self._start = array("q")
+        self._end = array("q")
+
+    @classmethod
+    def parse(cls, raw_text, pattern):
+        # Normalize line endings (바꿀 것이 없으면 복사하지 않음)
+        text = raw_text.replace("\r\n", "\n") if "\r\n" in raw_text else raw_text
+
+        manuscript = cls(text)
+        title = None  # 현재 챕터 제목의 (시작, 끝)
+        body_start = 0
+        for match in pattern.finditer(text):
+            if title is None:
+                # First part might be intro/metadata
+                if has_words(text, 0, match.start()):
+                    manuscript.has_intro = True
+                    manuscript._append(-1, -1, 0, match.start())
+            else:
+                manuscript._append_stripped(title, body_start, match.start())
+            title = strip_bounds(text, match.start(1), match.end(1))
+            body_start = match.end()
+
+        if title is None:
+            # No chapters found, treat as one
+            manuscript._append(-1, -1, 0, len(text))
+        else:
+            manuscript._append_stripped(title, body_start, len(text))
+        return manuscript
+
+    def _append(self, title_start, title_end, start, end):
+        self._title_start.append(title_start)
+        self._title_end.append(title_end)
+        self._start.append(start)
+        self._end.append(end)
+
+    def _append_stripped(self, title, start, end):
+        start, end = strip_bounds(self.text, start, end)
+        self._append(title[0], title[1], start, end)
+
+    def __len__(self):
+        return len(self._start)
+
+    def title(self, index):
+        start = self._title_start[index]
+        if start >= 0:
+            return self.text[start:self._title_end[index]]
+        return "Introduction" if self.has_intro and index == 0 else "Chapter 1"
+
+    def word_count(self, index):
+        return self.counts(index)['words']
+
+    def counts(self, index=None):
+        """
+        챕터(index가 None이면 원고 전체)의 {'words', 'chars', 'hangul'} (text_counts 참고).
+        원고 전체는 제목 줄을 포함하며, 제목은 줄 단위로 찾으므로 챕터별 수와 제목 줄 수의 합과 같다.
+        """
+        if index is None:
+            if self._totals is None:
+                self._totals = count_text(self.text)
+            return dict(self._totals)
+        if index < 0:
+            index += len(self)
+        counts = self._counts.get(index)
+        if counts is None:
+            counts = self._counts[index] = count_text(self.text, self._start[index], self._end[index])
+        return dict(counts)
+
+    @property
+    def total_words(self):
+        return self.counts()['words']
+
+    @property
+    def total_chars(self):
+        return self.counts()['chars']
+
+    @property
+    def total_hangul(self):
+        return self.counts()['hangul']
+
+    def chapter(self, index):
+        """(title, start, end, word_count)"""
+        return self.title(index), self._start[index], self._end[index], self.word_count(index)
+
+    @property
+    def chapters(self):
+        """[(title, start, end, word_count)] (필요할 때 만드는 목록)"""
+        return [self.chapter(i) for i in range(len(self))]
+
+    def chapter_text(self, index):
+        return self.text[self._start[index]:self._end[index]]
+
+    def iter_chapters(self):
+        """(title, content)를 순서대로 생성 (본문은 이때 잘라 냄)"""
+        for index in range(len(self)):
+            yield self.title(index), self.chapter_text(index)
+
+    def snippet(self, index, length=200):
+        """미리보기용 앞부분 (서문은 앞뒤 공백을 제외한 범위 기준)"""
+        start, end = self._start[index], self._end[index]
+        if index == 0 and self.has_intro:
+            start, end = strip_bounds(self.text, start, end)
+        if end - start > length:
+            return self.text[start:start + length] + '...'
+        return self.text[start:end]
+
+
+def strip_bounds(text, start, end):
+    """text[start:end].strip()에 해당하는 범위"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
@@ -0,0 +1,102 @@
+import re
+
+# 단어: 공백으로 나뉜 덩어리 (len(text.split())과 같은 기준)
+WORD_PATTERN = re.compile(r"\S+")
+HANGUL_PATTERN = re.compile("[가-힣]+")
+# UTF-8 첫 바이트가 0xEA~0xED인 문자 중 한글 음절(U+AC00~U+D7A3)이 아닌 것의 UTF-8 앞부분
+# (U+A000~U+ABFF, U+D7A4~U+D7FF, surrogatepass로 인코딩한 서로게이트)
+# 첫 바이트가 하나로 고정된 정규식이어야 빠르게 찾으므로 첫 바이트별로 나눔
+NON_HANGUL_3BYTE = (re.compile(b"\xea[\x80-\xaf]"), re.compile(b"\xed(?:\x9e[\xa4-\xbf]|[\x9f-\xbf])"))
+HANGUL_LEAD_BYTES = b"\xea\xeb\xec\xed"
+
+# 공백 문자(str.isspace, 정규식 \s와 같음). ASCII 공백은 translate로 " "로, 그 밖의 바이트는 "x"로 바꾸고
+# ASCII가 아닌 공백(U+0085, U+00A0, U+1680, U+2000~U+200A, U+2028, U+2029, U+202F, U+205F, U+3000)은
+# 그 전에 UTF-8 표현을 한 바이트 " "로 바꿔 둠 (NON_HANGUL_3BYTE와 같이 첫 바이트별 정규식)
+ASCII_SPACES = b"\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f "
+UNICODE_SPACES = (
+    re.compile(b"\xc2[\x85\xa0]"),
+    re.compile(b"\xe1\x9a\x80"),
+    re.compile(b"\xe2(?:\x80[\x80-\x8a\xa8\xa9\xaf]|\x81\x9f)"),
+    re.compile(b"\xe3\x80\x80"),
+)
+SPACE_MARKS = bytes(0x20 if b in ASCII_SPACES else 0x78 for b in range(256))
+
+# 한 번에 세는 구간 길이 (임시 문자열 크기를 이 정도로 묶어 둠)
+COUNT_CHUNK_SIZE = 1024 * 1024
+
+
+class TextCounter:
+    """
+    단어 수, 공백 제외 글자 수, 한글 음절 수를 한 번에 세는 카운터.
+    단어 목록을 만들지 않고 구간 단위로 세므로 큰 원고도 메모리 사용량이 늘지 않는다.
+    feed()를 여러 번 호출하면 이어진 텍스트로 보고 조각 경계에 걸친 단어를 한 번만 센다.
+    """
+
+    __slots__ = ("words", "chars", "hangul", "_in_word")
+
+    def __init__(self):
+        self.words = 0
+        self.chars = 0
+        self.hangul = 0
+        self._in_word = False  # 앞 조각이 공백이 아닌 글자로 끝났는지
+
+    def feed(self, text, start=0, end=None):
+        if end is None:
+            end = len(text)
+        for pos in range(start, end, COUNT_CHUNK_SIZE):
+            self._count(text[pos:min(pos + COUNT_CHUNK_SIZE, end)])
+        return self
+
+    def _count(self, chunk):
+        # 구간을 UTF-8로 인코딩해 공백은 " ", 나머지는 "x"인 바이트열로 바꾸면
+        # 단어 수는 " x"의 수(+ 맨 앞이 단어인 경우), 공백 수는 " "의 수 (모두 C 수준의 한 번 훑기)
+        data = chunk.encode("utf-8", "surrogatepass")
+        spaces = data
+        for pattern in UNICODE_SPACES:
+            spaces = pattern.sub(b" ", spaces)
+        marks = spaces.translate(SPACE_MARKS)
+        words = marks.count(b" x")
+        if marks[:1] == b"x" and not self._in_word:
+            words += 1
+        self._in_word = marks[-1:] == b"x"
+        self.words += words
+        self.chars += len(chunk) - marks.count(b" ")
+        self.hangul += _count_hangul(chunk, data)
+
+    def as_dict(self):
+        return {'words': self.words, 'chars': self.chars, 'hangul': self.hangul}
+
+
+def count_text(text, start=0, end=None):
+    """text[start:end]의 {'words', 'chars', 'hangul'}"""
+    return TextCounter().feed(text, start, end).as_dict()
+
+
+def count_stream(stream, chunk_size=COUNT_CHUNK_SIZE):
+    """텍스트 스트림을 끝까지 읽으며 셈"""
+    counter = TextCounter()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return counter.as_dict()
+        counter.feed(chunk)
+
+
+def count_hangul(text):
+    """한글 음절 수"""
+    return _count_hangul(text, text.encode("utf-8", "surrogatepass"))
+
+
+def _count_hangul(text, data):
+    # data: text를 UTF-8(surrogatepass)로 인코딩한 것
+    if any(pattern.search(data) for pattern in NON_HANGUL_3BYTE):
+        return len(text) - len(HANGUL_PATTERN.sub("", text))
+    # 위 문자가 없으면 UTF-8 첫 바이트 0xEA~0xED는 모두 한글 음절이므로 그 바이트를 지운 길이 차이로 셈
+    return len(data) - len(data.translate(None, HANGUL_LEAD_BYTES))
+
+
+def has_words(text, start=0, end=None):
+    """text[start:end]에 공백이 아닌 글자가 있는지"""
+    if end is None:
+        end = len(text)
+    return WORD_PATTERN.search(text, start, end) is not None
@@ -1,18 +1,169 @@
 import os
 import io
+import codecs
+import importlib
+import importlib.util
+import itertools
 import zipfile
+from collections import deque
 from xml.etree import ElementTree
 
-# Optional dependencies
-try:
-    from pypdf import PdfReader
-except ImportError:
-    PdfReader = None
+from cancellation import ConversionCancelled
+from conversion_stats import stage
 
-try:
-    import docx
-except ImportError:
-    docx = None
+# Optional dependencies: 확장자별 (모듈, pip 패키지). 해당 형식을 처음 추출할 때 import
+# DOCX는 zip 안의 XML을 직접 읽으므로 라이브러리가 필요 없음
+BACKENDS = {
+    ".pdf": ("pypdf", "pypdf"),
+    ".hwp": ("hwp5.hwp5txt", "pyhwp"),
+}
+
+
+# 추출 결과가 달라지는 변경을 하면 올릴 것 (추출 캐시 키에 포함됨)
+EXTRACTOR_VERSION = 2
+
+# TXT 인코딩 판별
+# cp949는 euc-kr을 포함하므로 euc-kr은 따로 시도하지 않음 (cp949가 실패하면 euc-kr도 실패)
+TXT_ENCODINGS = ["utf-8", "cp949", "latin-1"]
+TXT_BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+TXT_SAMPLE_SIZE = 64 * 1024
+
+# PDF 병렬 추출 시 워커 하나가 맡는 페이지 수
+PDF_SHARD_PAGES = 32
+
+# DOCX (WordprocessingML) 태그
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = W_NS + "body"
+W_P = W_NS + "p"
+W_R = W_NS + "r"
+W_T = W_NS + "t"
+W_HYPERLINK = W_NS + "hyperlink"
+W_PSTYLE = W_NS + "pStyle"
+W_OUTLINE_LEVEL = W_NS + "outlineLvl"
+W_VAL = W_NS + "val"
+W_TYPE = W_NS + "type"
+# 런 안의 특수 문자 요소 (python-docx의 Run.text와 같은 변환). 줄바꿈은 페이지/단 나누기가 아닐 때만
+W_RUN_CHARS = {
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "cr": "\n",
+    W_NS + "br": "\n",
+    W_NS + "noBreakHyphen": "-",
+}
+
+
+def _fallback_encodings(encoding):
+    """판별한 인코딩과, 그것이 뒤쪽에서 실패할 때 시도할 후보들 (latin-1은 항상 성공)"""
+    if encoding in TXT_ENCODINGS:
+        return TXT_ENCODINGS[TXT_ENCODINGS.index(encoding):]
+    return [encoding] + TXT_ENCODINGS
+
+
+def _iter_txt(file_path, info=None, observer=None, chunk_size=1024 * 1024):
+    """
+    TXT 파일을 청크 단위로 디코딩해 문자열 조각을 생성 (텍스트 모드 open()과 같이 \\r\\n, \\r 은 \\n 으로).
+    디코딩한 청크는 다음 청크까지 성공한 뒤에 내보낸다. 샘플로 고른 인코딩이 뒤쪽에서 실패하면
+    아직 내보내지 않은 부분(직전 청크부터)을 다음 후보 인코딩으로 다시 디코딩하므로, 실패 위치보다
+    앞에서 우연히 유효하게 읽힌 글자(ASCII 뒤 첫 cp949 한글이 UTF-8로 읽힌 경우 등)도 바로잡힌다.
+    info: 'encoding', 'confidence' (다음 후보로 넘어가면 그 인코딩과 0.0으로 바뀜)
+    observer: 청크마다 progress("extract", 읽은 바이트, 파일 크기)
+    """
+    total = os.path.getsize(file_path)
+    newlines = io.IncrementalNewlineDecoder(None, translate=True)
+    with open(file_path, "rb") as f:
+        sample = f.read(TXT_SAMPLE_SIZE)
+        encoding, confidence = TextExtractor.detect_encoding(
+            sample, final=len(sample) < TXT_SAMPLE_SIZE)
+        fallbacks = iter(_fallback_encodings(encoding)[1:])
+        decoder = codecs.getincrementaldecoder(encoding)()
+        if info is not None:
+            info['encoding'] = encoding
+            info['confidence'] = confidence
+        f.seek(0)
+        held = ""         # 디코딩했지만 아직 내보내지 않은 직전 청크의 텍스트
+        held_start = 0    # held가 시작하는 바이트 위치 (그 앞은 이미 내보냄)
+        while True:
+            chunk_start = f.tell() - len(decoder.getstate()[0])
+            chunk = f.read(chunk_size)
+            final = not chunk
+            try:
+                text = decoder.decode(chunk, final)
+            except UnicodeDecodeError:
+                # 내보내지 않은 부분을 다음 후보로 다시 디코딩 (latin-1은 항상 성공)
+                encoding = next(fallbacks)
+                decoder = codecs.getincrementaldecoder(encoding)()
+                if info is not None:
+                    info['encoding'] = encoding
+                    info['confidence'] = 0.0
+                f.seek(held_start)
+                held = ""
+                continue
+            if final:
+                text = newlines.decode(held + text, True)
+                if text:
+                    yield text
+                return
+            if held:
+                yield newlines.decode(held)
+            held, held_start = text, chunk_start
+            if observer is not None:
+                observer.progress("extract", f.tell(), total)
+
+
+class ChunkStream(io.TextIOBase):
+    """문자열 조각 iterator를 read(size)로 읽을 수 있는 텍스트 스트림으로 감쌈"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            result = self._buffer + "".join(self._chunks)
+            self._buffer = ""
+            return result
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        result, self._buffer = self._buffer[:size], self._buffer[size:]
+        return result
+
+    def close(self):
+        # 끝까지 읽지 않고 닫으면 남은 페이지/섹션 추출을 멈춤 (생성기 정리)
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+        super().close()
+
+
+class TxtStream(ChunkStream):
+    """읽는 대로 디코딩하는 TXT 파일 스트림 (_iter_txt). 처음으로 되감을 수 있다 (seek(0))"""
+
+    def __init__(self, file_path, info=None):
+        self._args = (file_path, info)
+        super().__init__(_iter_txt(file_path, info))
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("TxtStream은 처음으로만 되감을 수 있습니다.")
+        self._chunks.close()
+        self._chunks = _iter_txt(*self._args)
+        self._buffer = ""
+        return 0
 
 
 class ExtractionError(Exception):
@@ -25,86 +176,320 @@ class MissingLibraryError(ExtractionError):
     pass
 
 
+def require_library(module_name, package):
+    """
+    라이브러리를 처음 필요할 때 import (이후에는 sys.modules에서 바로 반환).
+    설치되어 있지 않으면 MissingLibraryError
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise MissingLibraryError(f"{package} 라이브러리가 필요합니다. `pip install {package}`로 설치하세요.")
+
+
+def load_backend(ext):
+    """확장자에 필요한 추출 라이브러리 모듈 (BACKENDS 참고)"""
+    return require_library(*BACKENDS[ext])
+
+
+def backend_available(ext):
+    """import하지 않고 추출 라이브러리 설치 여부만 확인 (별도 라이브러리가 필요 없으면 True)"""
+    if ext not in BACKENDS:
+        return True
+    module_name = BACKENDS[ext][0]
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ImportError:
+        # 상위 패키지가 없는 경우 (hwp5.hwp5txt 등)
+        return False
+
+
 class TextExtractor:
     @staticmethod
-    def extract(file_path):
+    def extract(file_path, info=None, workers=1, observer=None):
         """
         Extracts text from the given file based on its extension.
         Supports: .txt, .pdf, .docx, .hwp, .hwpx
+        info: optional dict filled with extraction details
+              (TXT: 'encoding', 'confidence' / PDF: 'pages' / DOCX: 'paragraphs', 'headings')
+        workers: processes for PDF page / HWPX section extraction
+        observer: optional ConversionObserver notified of the "extract" stage
+                  and of TXT byte / PDF page / HWPX section progress
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        with stage(observer, "extract") as counters:
+            text = TextExtractor._extract_by_type(file_path, info, workers, observer)
+            counters['bytes_in'] = os.path.getsize(file_path)
+            counters['chars_out'] = len(text)
+        return text
+
+    @staticmethod
+    def _extract_by_type(file_path, info, workers, observer):
         ext = os.path.splitext(file_path)[1].lower()
 
         if ext == ".txt":
-            return TextExtractor._extract_txt(file_path)
+            return TextExtractor._extract_txt(file_path, info, observer)
         elif ext == ".pdf":
-            return TextExtractor._extract_pdf(file_path)
+            return TextExtractor._extract_pdf(file_path, info, workers, observer)
         elif ext == ".docx":
-            return TextExtractor._extract_docx(file_path)
+            return TextExtractor._extract_docx(file_path, info)
         elif ext == ".hwp":
             return TextExtractor._extract_hwp(file_path)
         elif ext == ".hwpx":
-            return TextExtractor._extract_hwpx(file_path)
+            return TextExtractor._extract_hwpx(file_path, workers, observer)
         else:
             raise ValueError(f"Unsupported file format: {ext}")
 
     @staticmethod
-    def _extract_txt(file_path):
-        # Try common encodings
-        encodings = ["utf-8", "cp949", "euc-kr", "latin-1"]
-        for enc in encodings:
+    def _extract_txt(file_path, info=None, observer=None):
+        return "".join(_iter_txt(file_path, info, observer))
+
+    @staticmethod
+    def detect_encoding(sample, final=False):
+        """
+        바이트 샘플로 인코딩을 추정해 (encoding, confidence)를 반환.
+        BOM → UTF-8 → CP949(EUC-KR 포함) 순으로 확인하고, 모두 실패하면 latin-1.
+        final=False면 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않는다.
+        """
+        for bom, enc in TXT_BOMS:
+            if sample.startswith(bom):
+                return enc, 1.0
+
+        for enc in TXT_ENCODINGS[:-1]:
             try:
-                with open(file_path, "r", encoding=enc) as f:
-                    return f.read()
+                text = codecs.getincrementaldecoder(enc)().decode(sample, final)
             except UnicodeDecodeError:
                 continue
-        # Fallback
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read()
+            if text.isascii():
+                # ASCII만 있으면 구분할 수 없음 (UTF-8과 호환)
+                return enc, 0.5
+            if enc == "utf-8":
+                # 우연히 유효한 UTF-8 멀티바이트 열이 되는 경우는 드묾
+                return enc, 0.99
+            # 한국어 인코딩은 비ASCII 문자 중 한글 음절 비율로 점수화
+            non_ascii = sum(1 for ch in text if ord(ch) > 0x7F)
+            hangul = sum(1 for ch in text if "\uac00" <= ch <= "\ud7a3")
+            return enc, round(hangul / non_ascii, 2)
+
+        return TXT_ENCODINGS[-1], 0.0
+
+    @staticmethod
+    def open_txt(file_path, info=None):
+        """
+        TXT 파일을 인코딩을 판별해 텍스트 스트림으로 연다.
+        전체를 한 번에 읽지 않고 청크 단위로 처리할 때 사용.
+        인코딩은 앞부분 샘플로 고르고, 읽는 도중 디코딩에 실패하면 그 위치부터 다음 후보로 넘어간다.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        return TxtStream(file_path, info)
+
+    @staticmethod
+    def open_stream(file_path, info=None, workers=1, observer=None):
+        """
+        파일을 텍스트 스트림으로 연다. TXT는 파일에서 바로, PDF/HWPX는 페이지/섹션이
+        추출되는 대로 읽을 수 있어 챕터 분할을 추출과 동시에 시작할 수 있다.
+        observer: PDF 페이지/HWPX 섹션 진행률을 받음
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == ".txt":
+            return TextExtractor.open_txt(file_path, info)
+        if ext == ".pdf":
+            pages = TextExtractor.iter_pdf_pages(file_path, workers, info, observer)
+            return ChunkStream(_join_pages(pages))
+        if ext == ".hwpx":
+            return ChunkStream(TextExtractor.iter_hwpx_sections(file_path, workers, observer))
+        return io.StringIO(TextExtractor.extract(file_path, info, workers, observer))
 
     @staticmethod
-    def _extract_pdf(file_path):
-        if not PdfReader:
-            raise MissingLibraryError("pypdf 라이브러리가 필요합니다. `pip install pypdf`로 설치하세요.")
+    def iter_pdf_pages(file_path, workers=1, info=None, observer=None):
+        """
+        PDF 페이지 텍스트를 페이지 순서대로 생성.
+        workers > 1이면 페이지 구간을 여러 프로세스에 나눠 추출하고,
+        앞쪽 구간이 끝나는 대로 바로 내보낸다.
+        observer: 페이지마다 progress("extract", 페이지 번호, 전체 페이지 수)
+        """
+        PdfReader = load_backend(".pdf").PdfReader
 
         try:
             reader = PdfReader(file_path)
-            text = []
-            for page in reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text.append(extracted)
-            result = "\n".join(text)
+            page_count = len(reader.pages)
+            if info is not None:
+                info['pages'] = page_count
+
+            if workers <= 1 or page_count < PDF_SHARD_PAGES * 2:
+                for number, page in enumerate(reader.pages, 1):
+                    yield page.extract_text() or ""
+                    if observer is not None:
+                        observer.progress("extract", number, page_count)
+                return
+
+            del reader
+            ranges = ((start, min(start + PDF_SHARD_PAGES, page_count))
+                      for start in range(0, page_count, PDF_SHARD_PAGES))
+            done = 0
+            for pages in _map_pdf_ranges(file_path, ranges, workers):
+                yield from pages
+                done += len(pages)
+                if observer is not None:
+                    observer.progress("extract", done, page_count)
+        except (ExtractionError, ConversionCancelled):
+            raise
+        except Exception as e:
+            raise ExtractionError(f"PDF 추출 오류: {str(e)}")
+
+    @staticmethod
+    def _extract_pdf(file_path, info=None, workers=1, observer=None):
+        load_backend(".pdf")
+
+        try:
+            pages = TextExtractor.iter_pdf_pages(file_path, workers, info, observer)
+            result = "\n".join([page for page in pages if page])
             if not result.strip():
                 raise ExtractionError("PDF에서 텍스트를 추출할 수 없습니다. 이미지 기반 PDF일 수 있습니다.")
             return result
-        except ExtractionError:
+        except (ExtractionError, ConversionCancelled):
             raise
         except Exception as e:
             raise ExtractionError(f"PDF 추출 오류: {str(e)}")
 
     @staticmethod
-    def _extract_docx(file_path):
-        if not docx:
-            raise MissingLibraryError("python-docx 라이브러리가 필요합니다. `pip install python-docx`로 설치하세요.")
+    def read_pdf_outline(file_path, info=None):
+        """
+        PDF 북마크(목차)에서 챕터 구간 [(title, start_page, stop_page), ...]를 만든다.
+        여러 단계로 된 목차는 항목이 가장 많은 단계(보통 권 아래의 화/장)를 쓴다.
+        항목이 두 개보다 적거나, 페이지가 앞으로 가지 않거나 (한 페이지에 챕터가 둘 이상),
+        페이지를 알 수 없으면 구간으로 나눌 수 없으므로 None
+        """
+        PdfReader = load_backend(".pdf").PdfReader
 
         try:
-            doc = docx.Document(file_path)
-            result = "\n".join([para.text for para in doc.paragraphs])
-            if not result.strip():
-                raise ExtractionError("DOCX 파일이 비어있습니다.")
-            return result
-        except ExtractionError:
+            reader = PdfReader(file_path)
+            page_count = len(reader.pages)
+            if info is not None:
+                info['pages'] = page_count
+            levels = {}
+            for level, item in _flatten_outline(reader.outline):
+                page = reader.get_destination_page_number(item)
+                if page is None or not 0 <= page < page_count:
+                    return None
+                levels.setdefault(level, []).append(((item.title or "").strip(), page))
+        except Exception:
+            # 목차가 깨져 있으면 본문 정규식 분할로 처리
+            return None
+        if not levels:
+            return None
+
+        entries = max(levels.values(), key=len)
+        if len(entries) < 2:
+            return None
+        outline = []
+        for i, (title, page) in enumerate(entries):
+            stop = entries[i + 1][1] if i + 1 < len(entries) else page_count
+            if stop <= page:
+                return None
+            outline.append((title or f"Chapter {i + 1}", page, stop))
+        return outline
+
+    @staticmethod
+    def iter_pdf_chapters(file_path, outline, workers=1, observer=None, info=None):
+        """
+        read_pdf_outline의 구간마다 따로 추출해 (title, content) 챕터를 생성.
+        첫 북마크 앞 페이지에 글이 있으면 "Introduction" 챕터가 먼저 나온다 (info['intro']).
+        본문 첫 줄이 북마크 제목과 같으면 (줄이 나뉘어 있어도) 빼서 제목이 두 번 나오지 않게 함.
+        workers > 1이면 구간들을 여러 프로세스에서 동시에 추출하고 순서대로 내보낸다.
+        """
+        PdfReader = load_backend(".pdf").PdfReader
+
+        try:
+            ranges = [(None, 0, outline[0][1])] if outline[0][1] > 0 else []
+            ranges += outline
+            page_count = outline[-1][2]
+            spans = [(start, stop) for _, start, stop in ranges]
+            if workers <= 1 or page_count < PDF_SHARD_PAGES * 2:
+                reader = PdfReader(file_path)
+                texts = ([reader.pages[i].extract_text() or "" for i in range(start, stop)]
+                         for start, stop in spans)
+            else:
+                texts = _map_pdf_ranges(file_path, spans, workers)
+
+            if info is not None:
+                info['intro'] = False
+            for (title, start, stop), pages in zip(ranges, texts):
+                if observer is not None:
+                    observer.progress("extract", stop, page_count)
+                content = "\n".join([page for page in pages if page])
+                if title is None:
+                    if content.strip():
+                        if info is not None:
+                            info['intro'] = True
+                        yield "Introduction", content
+                else:
+                    yield title, _drop_title_lines(title, content.strip())
+        except (ExtractionError, ConversionCancelled):
+            raise
+        except Exception as e:
+            raise ExtractionError(f"PDF 추출 오류: {str(e)}")
+
+    @staticmethod
+    def iter_docx_paragraphs(file_path):
+        """
+        DOCX 본문 문단을 문서 순서대로 (제목 단계, 텍스트)로 생성.
+        word/document.xml을 점진적으로 파싱하므로 문서 모델 전체를 메모리에 만들지 않는다.
+        제목 단계: 제목 스타일(제목 1 → 1, 제목 2 → 2 …)이나 개요 수준이 있는 문단이면 1 이상, 아니면 0.
+        python-docx의 Document.paragraphs와 같이 본문 바로 아래 문단만 (표/글상자 안 문단 제외),
+        문단 텍스트도 문단이나 하이퍼링크 바로 아래 런에서만 모음 (변경 추적 w:ins, 콘텐츠 컨트롤 w:sdt 안 글자 제외)
+        """
+        try:
+            if not zipfile.is_zipfile(file_path):
+                raise ExtractionError("DOCX 파일이 유효한 ZIP 형식이 아닙니다.")
+
+            with zipfile.ZipFile(file_path, 'r') as z:
+                styles = _docx_heading_styles(z)
+                try:
+                    f = z.open("word/document.xml")
+                except KeyError:
+                    raise ExtractionError("DOCX 파일에서 본문을 찾을 수 없습니다.")
+                with f:
+                    yield from _parse_docx_body(f, styles)
+        except (ExtractionError, ConversionCancelled):
             raise
         except Exception as e:
             raise ExtractionError(f"DOCX 추출 오류: {str(e)}")
 
+    @staticmethod
+    def read_docx(file_path, info=None):
+        """
+        DOCX 본문을 (text, headings)로 읽음. text는 문단을 줄바꿈으로 이은 것 (_extract_docx와 같음),
+        headings는 제목 문단의 (단계, 시작, 끝) 목록 (text 안의 위치, 빈 제목 문단 제외)
+        info: 'paragraphs', 'headings' (제목 문단 수)
+        """
+        out = []
+        headings = []
+        pos = 0
+        for level, text in TextExtractor.iter_docx_paragraphs(file_path):
+            if level and text.strip():
+                headings.append((level, pos, pos + len(text)))
+            out.append(text)
+            pos += len(text) + 1
+        if info is not None:
+            info['paragraphs'] = len(out)
+            info['headings'] = len(headings)
+        return "\n".join(out), headings
+
+    @staticmethod
+    def _extract_docx(file_path, info=None):
+        result, _ = TextExtractor.read_docx(file_path, info)
+        if not result.strip():
+            raise ExtractionError("DOCX 파일이 비어있습니다.")
+        return result
+
     @staticmethod
     def _extract_hwp(file_path):
+        hwp5txt = load_backend(".hwp")
         try:
-            from hwp5.hwp5txt import TextTransform
             from hwp5.xmlmodel import Hwp5File
             from contextlib import closing
 
@@ -112,7 +497,7 @@ class TextExtractor:
             output = io.BytesIO()
 
             # hwp5txt transform setup
-            text_transform = TextTransform()
+            text_transform = hwp5txt.TextTransform()
             transform = text_transform.transform_hwp5_to_text
 
             with closing(Hwp5File(file_path)) as hwp5file:
@@ -130,7 +515,12 @@ class TextExtractor:
             raise ExtractionError(f"HWP 추출 오류: {str(e)}")
 
     @staticmethod
-    def _extract_hwpx(file_path):
+    def iter_hwpx_sections(file_path, workers=1, observer=None):
+        """
+        HWPX 섹션 텍스트를 섹션 번호 순서대로 생성.
+        workers > 1이면 섹션을 여러 프로세스에서 동시에 파싱한다.
+        observer: 섹션마다 progress("extract", 섹션 번호, 전체 섹션 수)
+        """
         try:
             if not zipfile.is_zipfile(file_path):
                 raise ExtractionError("HWPX 파일이 유효한 ZIP 형식이 아닙니다.")
@@ -138,29 +528,253 @@ class TextExtractor:
             with zipfile.ZipFile(file_path, 'r') as z:
                 # Find section files
                 content_files = [f for f in z.namelist() if f.startswith('Contents/section')]
-                if not content_files:
-                    raise ExtractionError("HWPX 파일에서 콘텐츠를 찾을 수 없습니다.")
-
-                full_text = []
-
-                # Sort to ensure correct order
-                for cf in sorted(content_files):
-                    with z.open(cf) as f:
-                        tree = ElementTree.parse(f)
-                        root = tree.getroot()
-
-                        for node in root.iter():
-                            tag = node.tag.split('}')[-1]  # strip namespace
-                            if tag == 't' and node.text:
-                                full_text.append(node.text)
-                            elif tag == 'p':
-                                full_text.append("\n")
-
-                result = "".join(full_text)
-                if not result.strip():
-                    raise ExtractionError("HWPX 파일이 비어있습니다.")
-                return result
-        except ExtractionError:
+            if not content_files:
+                raise ExtractionError("HWPX 파일에서 콘텐츠를 찾을 수 없습니다.")
+
+            # section10이 section2 뒤에 오도록 번호 순으로 정렬
+            content_files.sort(key=_section_sort_key)
+
+            total = len(content_files)
+            if workers <= 1 or total <= 1:
+                with zipfile.ZipFile(file_path, 'r') as z:
+                    for number, cf in enumerate(content_files, 1):
+                        with z.open(cf) as f:
+                            yield _parse_hwpx_section(f)
+                        if observer is not None:
+                            observer.progress("extract", number, total)
+                return
+
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(workers, total)) as pool:
+                try:
+                    names = iter(content_files)
+                    in_flight = deque(pool.submit(_extract_hwpx_section, file_path, cf)
+                                      for cf in itertools.islice(names, workers * 2))
+                    number = 0
+                    while in_flight:
+                        text = in_flight.popleft().result()
+                        for cf in itertools.islice(names, 1):
+                            in_flight.append(pool.submit(_extract_hwpx_section, file_path, cf))
+                        yield text
+                        number += 1
+                        if observer is not None:
+                            observer.progress("extract", number, total)
+                except BaseException:
+                    # 취소/중단 시 대기 중인 섹션은 시작하지 않음
+                    pool.shutdown(cancel_futures=True)
+                    raise
+        except (ExtractionError, ConversionCancelled):
             raise
         except Exception as e:
             raise ExtractionError(f"HWPX 추출 오류: {str(e)}")
+
+    @staticmethod
+    def _extract_hwpx(file_path, workers=1, observer=None):
+        result = "".join(TextExtractor.iter_hwpx_sections(file_path, workers, observer))
+        if not result.strip():
+            raise ExtractionError("HWPX 파일이 비어있습니다.")
+        return result
+
+def _extract_pdf_pages(file_path, start, stop):
+    """워커 프로세스에서 PDF 페이지 구간의 텍스트를 추출"""
+    reader = load_backend(".pdf").PdfReader(file_path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _map_pdf_ranges(file_path, ranges, workers):
+    """
+    (start, stop) 페이지 구간들을 프로세스 풀에서 추출해 구간 순서대로 페이지 텍스트 목록을 생성.
+    워커마다 자체 PdfReader를 열도록 경로와 페이지 구간만 넘긴다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = iter(ranges)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            in_flight = deque(pool.submit(_extract_pdf_pages, file_path, start, stop)
+                              for start, stop in itertools.islice(ranges, workers * 2))
+            while in_flight:
+                pages = in_flight.popleft().result()
+                for start, stop in itertools.islice(ranges, 1):
+                    in_flight.append(pool.submit(_extract_pdf_pages, file_path, start, stop))
+                yield pages
+        except BaseException:
+            # 취소/중단 시 대기 중인 구간은 시작하지 않음
+            pool.shutdown(cancel_futures=True)
+            raise
+
+
+def _flatten_outline(items, level=0):
+    # pypdf 목차: 하위 항목은 바로 앞 항목 뒤의 중첩 리스트
+    for item in items:
+        if isinstance(item, list):
+            yield from _flatten_outline(item, level + 1)
+        else:
+            yield level, item
+
+
+def _drop_title_lines(title, content):
+    """content 앞 줄(들)을 공백 없이 이어 붙인 것이 title과 같으면 그 줄들을 뺌"""
+    target = "".join(title.split())
+    seen = ""
+    pos = 0
+    while target and pos < len(content):
+        end = content.find("\n", pos)
+        if end < 0:
+            end = len(content)
+        seen += "".join(content[pos:end].split())
+        if not target.startswith(seen):
+            break
+        pos = end + 1
+        if seen == target:
+            return content[pos:].strip()
+    return content
+
+
+def _docx_heading_styles(z):
+    """
+    styles.xml에서 문단 스타일 id → 제목 단계. 이름이 "heading N"(지역화된 Word도 내부 이름은 영어)이거나
+    개요 수준이 있는 스타일, 그리고 그런 스타일을 기반으로 한 스타일
+    """
+    try:
+        root = ElementTree.fromstring(z.read("word/styles.xml"))
+    except KeyError:
+        return {}
+    own = {}
+    based_on = {}
+    for style in root.iter(W_NS + "style"):
+        if style.get(W_TYPE) != "paragraph":
+            continue
+        style_id = style.get(W_NS + "styleId")
+        name = style.find(W_NS + "name")
+        name = (name.get(W_VAL) or "").lower() if name is not None else ""
+        outline = style.find(f"{W_NS}pPr/{W_OUTLINE_LEVEL}")
+        if outline is not None:
+            own[style_id] = _outline_level(outline)
+        elif name.startswith("heading ") and name[8:].isdigit():
+            own[style_id] = int(name[8:])
+        parent = style.find(W_NS + "basedOn")
+        if parent is not None:
+            based_on[style_id] = parent.get(W_VAL)
+
+    levels = {}
+    for style_id in set(own) | set(based_on):
+        seen = set()
+        current = style_id
+        # 자기 단계가 없으면 기반 스타일을 따라 올라감 (순환 참조 방지)
+        while current not in own and current in based_on and current not in seen:
+            seen.add(current)
+            current = based_on[current]
+        if own.get(current):
+            levels[style_id] = own[current]
+    return levels
+
+
+def _outline_level(node):
+    # w:outlineLvl은 0부터 (9는 본문), 제목 단계는 1부터
+    try:
+        level = int(node.get(W_VAL))
+    except (TypeError, ValueError):
+        return 0
+    return level + 1 if 0 <= level < 9 else 0
+
+
+def _parse_docx_body(f, styles):
+    """
+    document.xml을 점진적으로 파싱해 본문 문단마다 (제목 단계, 텍스트)를 생성.
+    _parse_hwpx_section과 같이 처리가 끝난 요소는 부모에서 떼어 내 메모리를 일정하게 유지한다.
+    """
+    open_elements = []
+    depth = 0        # 열려 있는 w:p 수 (글상자 안 문단은 2 이상)
+    pieces = None    # 본문 바로 아래 문단이면 텍스트 조각 목록
+    run = None       # 텍스트를 모을 런 (문단이나 하이퍼링크 바로 아래 w:r)
+    level = 0
+    for event, node in ElementTree.iterparse(f, events=("start", "end")):
+        tag = node.tag
+        if event == "start":
+            if tag == W_P:
+                depth += 1
+                if depth == 1 and open_elements and open_elements[-1].tag == W_BODY:
+                    pieces = []
+                    level = 0
+            elif pieces is not None and depth == 1:
+                if tag == W_PSTYLE:
+                    level = styles.get(node.get(W_VAL), 0)
+                elif tag == W_OUTLINE_LEVEL:
+                    # 문단에 직접 지정한 개요 수준이 스타일보다 우선
+                    level = _outline_level(node)
+                elif tag == W_R:
+                    parent = open_elements[-1]
+                    if parent.tag == W_P or (parent.tag == W_HYPERLINK and open_elements[-2].tag == W_P):
+                        run = node
+                elif tag in W_RUN_CHARS and open_elements[-1] is run:
+                    if node.get(W_TYPE) in (None, "textWrapping"):
+                        pieces.append(W_RUN_CHARS[tag])
+            open_elements.append(node)
+        else:
+            if tag == W_T:
+                if pieces is not None and depth == 1 and open_elements[-2] is run:
+                    pieces.append(node.text or "")
+            elif tag == W_P:
+                depth -= 1
+                if not depth and pieces is not None:
+                    yield level, "".join(pieces)
+                    pieces = None
+                    run = None
+            open_elements.pop()
+            if open_elements:
+                del open_elements[-1][-1]
+            node.clear()
+
+
+def _join_pages(pages):
+    # _extract_pdf와 같이 빈 페이지를 건너뛰고 줄바꿈으로 연결
+    first = True
+    for page in pages:
+        if not page:
+            continue
+        if not first:
+            yield "\n"
+        yield page
+        first = False
+
+
+def _section_sort_key(name):
+    digits = "".join(ch for ch in os.path.basename(name) if ch.isdigit())
+    return (int(digits) if digits else -1, name)
+
+
+def _extract_hwpx_section(file_path, name):
+    """워커 프로세스에서 HWPX 섹션 하나를 파싱"""
+    with zipfile.ZipFile(file_path, 'r') as z:
+        with z.open(name) as f:
+            return _parse_hwpx_section(f)
+
+
+def _parse_hwpx_section(f):
+    """
+    섹션 XML을 점진적으로 파싱해 텍스트를 반환.
+    문서 순서대로 <p> 시작마다 줄바꿈, <t>마다 텍스트를 넣고,
+    처리가 끝난 요소는 부모에서 떼어 내 메모리를 섹션 크기와 무관하게 유지한다.
+    """
+    out = []
+    open_elements = []
+    text_slots = []  # 아직 닫히지 않은 <t>의 out 위치
+    for event, node in ElementTree.iterparse(f, events=("start", "end")):
+        tag = node.tag.split('}')[-1]  # strip namespace
+        if event == "start":
+            if tag == 't':
+                text_slots.append(len(out))
+                out.append("")
+            elif tag == 'p':
+                out.append("\n")
+            open_elements.append(node)
+        else:
+            if tag == 't':
+                out[text_slots.pop()] = node.text or ""
+            open_elements.pop()
+            if open_elements:
+                # 닫힌 요소는 항상 부모의 마지막 자식
+                del open_elements[-1][-1]
+            node.clear()
+    return "".join(out)